@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+日志设置
+程序的日志都在 nas 日志器之下（如 nas.gui），默认只输出警告和错误；
+通过 --log-level 参数或环境变量 NAS_LOG_LEVEL 调整级别。
+窗口缩放、逐块转换等高频事件使用 ThrottledDebug，限制调试日志的输出频率
+"""
+
+import logging
+import os
+import time
+
+# 所有日志器的上级
+LOGGER_NAME = 'nas'
+
+# 指定日志级别的环境变量
+LOG_LEVEL_ENV = 'NAS_LOG_LEVEL'
+
+# 默认级别：只输出警告和错误
+DEFAULT_LOG_LEVEL = 'WARNING'
+
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+
+LOG_FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
+
+
+def setup_logging(level=None):
+    """配置 nas 日志器输出到标准错误：level 为 None 时读取环境变量 NAS_LOG_LEVEL，都没有时为 WARNING"""
+    logger = logging.getLogger(LOGGER_NAME)
+    name = (level or os.environ.get(LOG_LEVEL_ENV) or DEFAULT_LOG_LEVEL).upper()
+    if name not in LOG_LEVELS:
+        invalid, name = name, DEFAULT_LOG_LEVEL
+    else:
+        invalid = None
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(name)
+    if invalid:
+        logger.warning("未知的日志级别 %s，使用 %s（可选 %s）", invalid, name, '、'.join(LOG_LEVELS))
+    return logger
+
+
+def level_from_argv(argv):
+    """从命令行参数中取出 --log-level 的值（--log-level 级别 或 --log-level=级别），没有时返回 None"""
+    for index, arg in enumerate(argv):
+        if arg.startswith('--log-level='):
+            return arg.partition('=')[2]
+        if arg == '--log-level' and index + 1 < len(argv):
+            return argv[index + 1]
+    return None
+
+
+class ThrottledDebug:
+    """高频事件的调试日志：同一事件每 interval 秒最多输出一条，期间被合并的次数附在下一条中
+
+    未开启调试级别时调用只需一次级别判断。
+    """
+
+    def __init__(self, logger, interval=1.0):
+        self.logger = logger
+        self.interval = interval
+        self._last = {}  # 事件 -> 上次输出的时间
+        self._merged = {}  # 事件 -> 上次输出后被合并的次数
+
+    def __call__(self, event, message, *args):
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        now = time.monotonic()
+        last = self._last.get(event)
+        if last is not None and now - last < self.interval:
+            self._merged[event] = self._merged.get(event, 0) + 1
+            return
+        self._last[event] = now
+        merged = self._merged.pop(event, 0)
+        if merged:
+            message += "（此前 %d 次已合并）"
+            args += (merged,)
+        self.logger.debug(message, *args)
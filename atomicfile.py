@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+原子写入文件
+先写入同目录下的临时文件并刷新到磁盘，再一次性替换原文件：
+写入过程中程序崩溃或断电时，原文件保持完整，不会留下只写了一半的文件
+"""
+
+import os
+import shutil
+import threading
+
+
+def write_text_atomic(path, text, encoding='utf-8'):
+    """将 text 原子地写入 path，原文件存在时保留其权限"""
+    temp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp, 'w', encoding=encoding) as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, temp)
+        os.replace(temp, path)
+    except BaseException:
+        try:
+            os.remove(temp)
+        except OSError:
+            pass
+        raise
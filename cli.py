@@ -0,0 +1,572 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+NAS路径转换工具 - 命令行模式
+分块流式读取标准输入或文件（文件通过内存映射读取），转换后写入标准输出或文件
+内存占用与输入大小无关，且不导入PyQt5
+"""
+
+import argparse
+import codecs
+import io
+import json
+import mmap
+import os
+import sys
+import time
+
+from converter import DEFAULT_DRIVE, DEFAULT_NAS_PREFIX, DIRECTIONS, TO_LINUX, PathConverter
+
+# 默认配置文件路径（与GUI共用）
+DEFAULT_CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json')
+
+# 以下模块只在用到对应功能时才导入（asyncio、sqlite3 和进程池会明显拖慢启动），
+# 命令行参数的默认值因此在这里另列一份，须与各模块中的同名常量保持一致（见 tests/test_cli.py）
+DEFAULT_HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'history.db')  # history
+DEFAULT_SEARCH_LIMIT = 200  # history
+PLAN_FORMATS = ('json', 'csv')  # planner
+DEFAULT_CONCURRENCY = 8  # qbt_sync
+DEFAULT_RETRIES = 3  # qbt_sync
+DEFAULT_WATCH_INTERVAL = 2.0  # qbt_sync
+DEFAULT_WALK_WORKERS = 16  # walker
+
+
+def load_config(config_file):
+    """读取配置文件，读取失败时返回空配置（使用默认前缀）"""
+    try:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return config if isinstance(config, dict) else {}
+
+
+def parse_map_option(value):
+    """解析 --map 参数：Windows路径=NAS前缀"""
+    source, sep, prefix = value.partition('=')
+    if not sep:
+        raise argparse.ArgumentTypeError(f"格式应为 盘符或共享=NAS前缀：{value}")
+    return source, prefix
+
+
+# 每次读取的字符数，按整行切分后整块转换
+BLOCK_SIZE = 1 << 20
+
+
+def read_blocks(src, block_size=BLOCK_SIZE):
+    """按固定大小读取输入，并在最后一个换行处切分，保证每块都是完整的行"""
+    tail = ''
+    while True:
+        chunk = src.read(block_size)
+        if not chunk:
+            break
+        chunk = tail + chunk
+        cut = chunk.rfind('\n') + 1
+        if cut == 0:
+            tail = chunk
+            continue
+        tail = chunk[cut:]
+        yield chunk[:cut]
+    if tail:
+        yield tail
+
+
+def convert_stream(src, out, convert_block, record=None):
+    """分块转换输入流并写出，跳过空行；指定 record 时对每块调用 record(块, 转换结果)"""
+    write = out.write
+    for block in read_blocks(src):
+        converted = convert_block(block)
+        if record is not None:
+            record(block, converted)
+        if converted:
+            write(converted)
+            write('\n')
+
+
+# 内存映射模式下每块的字节数
+MMAP_CHUNK_SIZE = 1 << 22
+
+
+def convert_file_mmap(path, out, convert_bytes, chunk_size=MMAP_CHUNK_SIZE, progress=None):
+    """内存映射输入文件，按整行分块直接在字节上转换，经缓冲写出
+
+    每写出一块后调用 progress(已处理的字节数)，返回 False 时停止转换。
+    """
+    out.flush()
+    write = out.buffer.write
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            can_advise = hasattr(mm, 'madvise')
+            if can_advise:
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            # 跳过Windows记事本等写入的UTF-8 BOM
+            start = len(codecs.BOM_UTF8) if mm[:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8 else 0
+            released = 0
+            while start < size:
+                end = mm.find(b'\n', start + chunk_size)
+                end = size if end == -1 else end + 1
+                write(convert_bytes(mm[start:end]))
+                start = end
+                if progress is not None and progress(start) is False:
+                    return
+                # 释放已处理部分的页面映射，使常驻内存不随文件大小增长
+                if can_advise:
+                    release_end = start - start % mmap.PAGESIZE
+                    if release_end > released:
+                        mm.madvise(mmap.MADV_DONTNEED, released, release_end - released)
+                        released = release_end
+
+
+# 并行模式下每个任务处理的字节数
+PARALLEL_CHUNK_SIZE = 1 << 22
+
+# 子进程内的字节转换函数，由 _init_worker 设置
+_worker_convert_bytes = None
+
+
+def _init_worker(converter, direction):
+    """子进程初始化：取得指定方向的字节转换函数"""
+    global _worker_convert_bytes
+    _worker_convert_bytes = converter.bytes_function(direction)
+
+
+def _convert_range(path, start, end):
+    """子进程任务：转换文件中 [start, end) 字节范围内的整行，返回编码后的结果"""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return _worker_convert_bytes(data)
+
+
+def line_aligned_ranges(path, chunk_size=PARALLEL_CHUNK_SIZE):
+    """将文件切分为若干字节范围，每个范围都在换行符之后结束"""
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, 'rb') as f:
+        start = len(codecs.BOM_UTF8) if f.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8 else 0
+        while start < size:
+            f.seek(min(start + chunk_size, size))
+            f.readline()  # 跳到下一个换行符之后
+            end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def convert_file_parallel(path, out, converter, direction, jobs):
+    """多进程转换文件：按字节范围分块并行转换，再按原顺序写出"""
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    out.flush()
+    write = out.buffer.write
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(converter, direction)) as executor:
+        # 限制同时在途的任务数，保证内存占用不随文件大小增长
+        pending = deque()
+        for start, end in line_aligned_ranges(path):
+            pending.append(executor.submit(_convert_range, path, start, end))
+            if len(pending) >= jobs * 2:
+                write(pending.popleft().result())
+        while pending:
+            write(pending.popleft().result())
+    out.buffer.flush()
+
+
+def qbittorrent_instances(args, config):
+    """汇总要同步的实例：命令行指定的地址，以及 --qbt-all 时配置文件中的所有实例"""
+    instances = [
+        {'url': url, 'username': args.qbt_user, 'password': args.qbt_password}
+        for url in args.qbt_urls
+    ]
+    if args.qbt_all:
+        configured = config.get('qbittorrent_instances') or []
+        if not configured:
+            raise ValueError("配置文件中没有 qbittorrent_instances")
+        for instance in configured:
+            if not isinstance(instance, dict) or not instance.get('url'):
+                raise ValueError(f"qbittorrent_instances 中的每一项都需要包含 url：{instance!r}")
+        instances.extend(configured)
+    return instances
+
+
+def sync_qbittorrent(instances, convert_path, args, out):
+    """并发同步所有实例，输出每个实例的移动计划及处理速度，有实例失败时返回 1"""
+    import asyncio
+    from qbt_sync import sync_instances
+
+    results = asyncio.run(sync_instances(
+        instances, convert_path, concurrency=args.qbt_concurrency, rate=args.qbt_rate,
+        retries=args.qbt_retries,
+    ))
+    for result in results:
+        for location, hashes in result.plan.items():
+            out.write(f"{result.name}\t{len(hashes)}\t{location}\n")
+    out.flush()
+
+    status = 0
+    for result in results:
+        summary = (f"{result.name}: 移动 {result.moved}/{result.torrents} 个种子，{result.requests} 次请求，"
+                   f"重试 {result.retries} 次，用时 {result.elapsed:.2f} 秒"
+                   f"（{result.torrents_per_second:.0f} 种子/秒，{result.requests_per_second:.1f} 请求/秒）")
+        if result.error is not None:
+            summary += f"，失败: {result.error}"
+            status = 1
+        print(summary, file=sys.stderr)
+    return status
+
+
+def plan_qbittorrent(instances, convert_path, args, out):
+    """试运行：只读取所有实例的种子并输出移动计划，不移动任何种子，有实例失败时返回 1"""
+    import asyncio
+    from planner import build_plan, summarize_plan, write_plan
+    from qbt_sync import fetch_instances
+
+    fetched = asyncio.run(fetch_instances(
+        instances, concurrency=args.qbt_concurrency, rate=args.qbt_rate, retries=args.qbt_retries,
+    ))
+    summaries = []
+    status = 0
+    for result, torrents in fetched:
+        if result.error is not None:
+            print(f"{result.name}: 失败: {result.error}", file=sys.stderr)
+            status = 1
+            continue
+        summaries.append(summarize_plan(result.name, len(torrents), build_plan(torrents, convert_path)))
+    write_plan(summaries, out, args.plan_format)
+    return status
+
+
+def plan_file(name, convert_path, args, out):
+    """试运行：读取 torrents/info 导出的种子列表并输出移动计划"""
+    from planner import build_plan, load_torrents, summarize_plan, write_plan
+
+    src = open_input(name)
+    try:
+        torrents = load_torrents(src)
+    finally:
+        if name != '-':
+            src.close()
+    write_plan([summarize_plan(name, len(torrents), build_plan(torrents, convert_path))], out, args.plan_format)
+    return 0
+
+
+def watch_qbittorrent(instances, convert_path, args, out):
+    """持续监视所有实例，只移动新增或保存路径有变化的种子，并随时输出移动计划，按 Ctrl+C 结束"""
+    import asyncio
+    from qbt_sync import watch_instances
+
+    def report(result, plan):
+        for location, hashes in plan.items():
+            out.write(f"{result.name}\t{len(hashes)}\t{location}\n")
+        out.flush()
+        if result.error is not None:
+            print(f"{result.name}: 失败: {result.error}", file=sys.stderr)
+
+    print(f"正在监视 {len(instances)} 个实例（每 {args.qbt_interval:g} 秒检查一次），按 Ctrl+C 结束", file=sys.stderr)
+    try:
+        asyncio.run(watch_instances(
+            instances, convert_path, interval=args.qbt_interval, concurrency=args.qbt_concurrency,
+            rate=args.qbt_rate, retries=args.qbt_retries, report=report,
+        ))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def walk_tree(root, convert_path, args, out, record=None):
+    """遍历目录树，转换其中每个文件和目录的路径，每扫描完一个目录就写出一批，有目录或链接无法读取时返回 1
+
+    指定 record 时对每批调用 record(原路径列表, 转换结果列表)。
+    """
+    from walker import walk_paths
+
+    errors = []
+
+    def report(error):
+        errors.append(error)
+        print(f"警告: 无法读取 {error.filename}: {error.strerror}", file=sys.stderr)
+
+    write = out.write
+    count = 0
+    start = time.perf_counter()
+    for paths in walk_paths(root, args.walk_as, args.walk_workers, args.walk_follow_links, report):
+        count += len(paths)
+        results = list(map(convert_path, paths))
+        if record is not None:
+            record([path for path, converted in zip(paths, results) if converted], list(filter(None, results)))
+        if args.walk_pairs:
+            lines = [f"{path}\t{converted}" for path, converted in zip(paths, results)]
+        else:
+            lines = list(filter(None, results))
+        if lines:
+            write('\n'.join(lines))
+            write('\n')
+    out.flush()
+    elapsed = time.perf_counter() - start
+    print(f"已遍历 {count} 个文件和目录，用时 {elapsed:.2f} 秒（{count / elapsed if elapsed else 0:.0f} 个/秒）"
+          + (f"，{len(errors)} 个目录或链接无法读取" if errors else ""), file=sys.stderr)
+    return 1 if errors else 0
+
+
+def search_history(history, text, limit, out):
+    """查询转换历史，每条记录输出一行：原路径、转换结果、方向、首次和最近一次转换的时间、次数（以Tab分隔）"""
+    def format_time(timestamp):
+        return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+
+    start = time.perf_counter()
+    entries = history.search(text, limit)
+    elapsed = time.perf_counter() - start
+    for entry in entries:
+        out.write(f"{entry.source}\t{entry.target}\t{entry.direction}\t{format_time(entry.first_seen)}\t"
+                  f"{format_time(entry.last_seen)}\t{entry.count}\n")
+    out.flush()
+    print(f"找到 {len(entries)} 条记录，用时 {elapsed * 1000:.1f} 毫秒", file=sys.stderr)
+    return 0 if entries else 1
+
+
+def open_input(name):
+    """打开输入，- 表示标准输入"""
+    if name == '-':
+        return io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8-sig', errors='surrogateescape')
+    return open(name, 'r', encoding='utf-8-sig', errors='surrogateescape')
+
+
+def is_same_file(name, output):
+    """输入 name 与输出 output 是否为同一个文件（标准输入输出除外）"""
+    if name == '-' or output is None or output == '-':
+        return False
+    try:
+        return os.path.samefile(name, output)
+    except OSError:
+        return False
+
+
+def open_output(name):
+    """打开输出，None 或 - 表示标准输出"""
+    if name is None or name == '-':
+        return io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='surrogateescape',
+                                newline='\n', write_through=False)
+    return open(name, 'w', encoding='utf-8', errors='surrogateescape', newline='\n')
+
+
+def build_parser():
+    """构建命令行参数解析器"""
+    parser = argparse.ArgumentParser(
+        prog='main.py --cli',
+        description='Windows路径转Linux NAS路径（命令行模式，每行一个路径）'
+    )
+    parser.add_argument('inputs', nargs='*', default=['-'],
+                        help='输入文件，省略或为 - 时读取标准输入')
+    parser.add_argument('-o', '--output', default=None,
+                        help='输出文件，省略或为 - 时写入标准输出')
+    parser.add_argument('--prefix', default=None,
+                        help='默认NAS路径前缀，默认读取配置文件中的 nas_prefix')
+    parser.add_argument('-m', '--map', dest='mappings', action='append', default=[],
+                        type=parse_map_option, metavar='路径=前缀',
+                        help='追加盘符或UNC共享的映射，如 Z:=/share/media，可重复指定，'
+                             '优先于配置文件中的 path_mappings')
+    parser.add_argument('-d', '--direction', choices=DIRECTIONS, default=TO_LINUX,
+                        help='转换方向：to-linux（Windows转NAS，默认）、to-windows（NAS转Windows）、'
+                             'auto（按行自动识别）')
+    parser.add_argument('--config', default=DEFAULT_CONFIG_FILE,
+                        help='配置文件路径，默认与 main.py 同目录的 config.json')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='并行转换的进程数，仅对输入文件生效（标准输入始终单进程），默认为 1')
+
+    qbt = parser.add_argument_group('qBittorrent', '转换qBittorrent中所有种子的保存路径并批量移动（此时不读取输入）')
+    qbt.add_argument('--qbt-url', dest='qbt_urls', action='append', default=[], metavar='URL',
+                     help='WebUI地址，如 http://localhost:8080，可重复指定以同时同步多个实例')
+    qbt.add_argument('--qbt-all', action='store_true',
+                     help='同步配置文件中 qbittorrent_instances 列出的所有实例')
+    qbt.add_argument('--qbt-user', default=None,
+                     help='--qbt-url 指定的实例的用户名，省略时不登录（适用于免登录的本机或白名单地址）')
+    qbt.add_argument('--qbt-password', default=os.environ.get('QBT_PASSWORD'),
+                     help='--qbt-url 指定的实例的密码，默认读取环境变量 QBT_PASSWORD')
+    qbt.add_argument('--qbt-concurrency', type=int, default=DEFAULT_CONCURRENCY, metavar='N',
+                     help=f'所有实例合计同时进行的请求数，默认为 {DEFAULT_CONCURRENCY}')
+    qbt.add_argument('--qbt-rate', type=float, default=0, metavar='N',
+                     help='每个主机每秒的最大请求数，默认不限制')
+    qbt.add_argument('--qbt-dry-run', action='store_true',
+                     help='试运行：只读取种子并输出移动计划（格式见 --plan-format），不移动任何种子')
+    qbt.add_argument('--qbt-watch', action='store_true',
+                     help='监视模式：通过 sync/maindata 持续获取有变化的种子并移动，直到按 Ctrl+C')
+    qbt.add_argument('--qbt-interval', type=float, default=DEFAULT_WATCH_INTERVAL, metavar='秒',
+                     help=f'监视模式下两次检查的间隔，默认为 {DEFAULT_WATCH_INTERVAL:g} 秒')
+    qbt.add_argument('--qbt-retries', type=int, default=DEFAULT_RETRIES, metavar='N',
+                     help=f'连接失败或服务器错误时的重试次数，默认为 {DEFAULT_RETRIES}')
+
+    plan = parser.add_argument_group('移动计划', '试运行：按目标目录分组输出会变化的种子，不连接qBittorrent')
+    plan.add_argument('--plan', default=None, metavar='文件',
+                      help='读取 torrents/info 导出的JSON种子列表（- 为标准输入）并输出移动计划')
+    plan.add_argument('--plan-format', choices=PLAN_FORMATS, default='json',
+                      help='移动计划的输出格式，默认为 json')
+
+    walk = parser.add_argument_group('目录遍历', '并行遍历目录树，转换其中所有文件和目录的路径（此时不读取输入）')
+    walk.add_argument('--walk', default=None, metavar='目录',
+                      help='要遍历的目录，如挂载的Windows盘符根目录，目录的转换结果以 / 结尾')
+    walk.add_argument('--walk-as', default=None, metavar='路径',
+                      help='把 --walk 目录替换为该路径后再转换，如 --walk /mnt/z --walk-as Z:\\')
+    walk.add_argument('--walk-workers', type=int, default=DEFAULT_WALK_WORKERS, metavar='N',
+                      help=f'同时扫描的目录数，默认为 {DEFAULT_WALK_WORKERS}')
+    walk.add_argument('--walk-pairs', action='store_true',
+                      help='每行输出"原路径<Tab>转换结果"')
+    walk.add_argument('--walk-follow-links', action='store_true',
+                      help='进入指向目录的符号链接（每个目录只进入一次，不会因链接循环），默认只列出不进入')
+
+    history = parser.add_argument_group('转换历史', '把转换过的路径记录到SQLite数据库，按原路径或转换结果查询')
+    history.add_argument('--history', nargs='?', const=DEFAULT_HISTORY_FILE, default=None, metavar='数据库',
+                         help='记录本次转换的所有路径（含 --walk），省略数据库路径时使用与 main.py 同目录的 '
+                              'history.db；记录时输入文件按文本流读取，不使用内存映射和 --jobs')
+    history.add_argument('--history-search', default=None, metavar='前缀',
+                         help='查询原路径或转换结果以该前缀开头（区分大小写）的记录（此时不读取输入），'
+                              '每行输出"原路径、转换结果、方向、首次转换时间、最近转换时间、次数"（以Tab分隔）')
+    history.add_argument('--history-limit', type=int, default=DEFAULT_SEARCH_LIMIT, metavar='N',
+                         help=f'查询最多输出的记录数，默认为 {DEFAULT_SEARCH_LIMIT}')
+    return parser
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs 必须大于等于 1")
+    config = load_config(args.config)
+    nas_prefix = args.prefix if args.prefix is not None else config.get('nas_prefix', DEFAULT_NAS_PREFIX)
+    mappings = dict(config.get('path_mappings') or {})
+    mappings.update(args.mappings)
+    try:
+        converter = PathConverter(nas_prefix, mappings, config.get('default_drive', DEFAULT_DRIVE))
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.history_search is None and args.history is None:
+        return dispatch(args, parser, config, converter, None)
+
+    from history import ConversionHistory, HistoryError
+
+    if args.history_limit < 1:
+        parser.error("--history-limit 必须大于等于 1")
+    try:
+        # 只查询时以只读方式打开，数据库不存在时报错而不是创建空数据库
+        history = ConversionHistory(args.history or DEFAULT_HISTORY_FILE,
+                                    readonly=args.history_search is not None)
+    except HistoryError as e:
+        print(f"错误: {e}", file=sys.stderr)
+        return 1
+    try:
+        return dispatch(args, parser, config, converter, history)
+    except HistoryError as e:
+        print(f"错误: {e}", file=sys.stderr)
+        return 1
+    finally:
+        history.close()
+
+
+def dispatch(args, parser, config, converter, history):
+    """按参数执行查询、遍历、qBittorrent同步或转换输入"""
+    if args.history_search is not None:
+        out = open_output(args.output)
+        try:
+            return search_history(history, args.history_search, args.history_limit, out)
+        finally:
+            if args.output not in (None, '-'):
+                out.close()
+
+    if args.plan is not None:
+        if is_same_file(args.plan, args.output):
+            parser.error(f"输出文件不能与输入文件相同：{args.output}")
+        out = open_output(args.output)
+        try:
+            return plan_file(args.plan, converter.path_function(args.direction), args, out)
+        except (OSError, ValueError) as e:
+            print(f"错误: {e}", file=sys.stderr)
+            return 1
+        finally:
+            if args.output not in (None, '-'):
+                out.close()
+
+    if args.walk is not None:
+        if args.walk_workers < 1:
+            parser.error("--walk-workers 必须大于等于 1")
+        if not os.path.isdir(args.walk):
+            parser.error(f"--walk 不是目录：{args.walk}")
+        out = open_output(args.output)
+        try:
+            record = None if history is None else (
+                lambda sources, results: history.record(sources, results, args.direction))
+            return walk_tree(args.walk, converter.path_function(args.direction), args, out, record)
+        except BrokenPipeError:
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            return 0
+        finally:
+            if args.output not in (None, '-'):
+                out.close()
+
+    try:
+        instances = qbittorrent_instances(args, config)
+    except ValueError as e:
+        parser.error(str(e))
+    if instances:
+        if args.qbt_concurrency < 1 or args.qbt_retries < 0 or args.qbt_rate < 0 or args.qbt_interval < 0:
+            parser.error("--qbt-concurrency 必须大于等于 1，--qbt-retries、--qbt-rate 与 --qbt-interval 不能为负数")
+        if args.qbt_dry_run and args.qbt_watch:
+            parser.error("--qbt-dry-run 不能与 --qbt-watch 同时使用")
+        out = open_output(args.output)
+        try:
+            if args.qbt_dry_run:
+                run = plan_qbittorrent
+            else:
+                run = watch_qbittorrent if args.qbt_watch else sync_qbittorrent
+            return run(instances, converter.path_function(args.direction), args, out)
+        except ValueError as e:
+            parser.error(str(e))
+        finally:
+            if args.output not in (None, '-'):
+                out.close()
+
+    record = None
+    if history is not None:
+        convert = converter.path_function(args.direction)
+        record = lambda block, converted: history.record_block(block, converted, convert, args.direction)
+    # 输出文件在读取输入之前就会被清空，与输入相同时会丢失全部内容
+    for name in args.inputs:
+        if is_same_file(name, args.output):
+            parser.error(f"输出文件不能与输入文件相同：{name}")
+    out = open_output(args.output)
+    try:
+        for name in args.inputs:
+            if name != '-' and os.path.isfile(name) and record is None:
+                if args.jobs > 1:
+                    convert_file_parallel(name, out, converter, args.direction, args.jobs)
+                else:
+                    convert_file_mmap(name, out, converter.bytes_function(args.direction))
+                continue
+            src = open_input(name)
+            try:
+                convert_stream(src, out, converter.block_function(args.direction), record)
+            finally:
+                if name != '-':
+                    src.close()
+        out.flush()
+    except BrokenPipeError:
+        # 下游管道提前关闭（如 | head），将标准输出指向空设备后静默退出
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+    except OSError as e:
+        print(f"错误: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if args.output not in (None, '-'):
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
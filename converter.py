@@ -0,0 +1,610 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+路径转换核心逻辑
+不依赖PyQt5，供GUI、命令行模式及其他脚本共同使用
+"""
+
+import re
+import string
+from functools import lru_cache
+
+# 默认NAS路径前缀
+DEFAULT_NAS_PREFIX = "/share"
+
+# 反向转换时默认前缀对应的盘符
+DEFAULT_DRIVE = "Z:"
+
+# 转换方向
+TO_LINUX = "to-linux"  # Windows路径 -> Linux NAS路径
+TO_WINDOWS = "to-windows"  # Linux NAS路径 -> Windows路径
+AUTO = "auto"  # 按行自动识别
+DIRECTIONS = (TO_LINUX, TO_WINDOWS, AUTO)
+
+# 分块转换时每块的大致字符数
+DEFAULT_BLOCK_SIZE = 1 << 18
+
+# 目录前缀缓存默认保存的目录数
+DEFAULT_CACHE_SIZE = 4096
+
+# 连续斜杠
+_SLASHES = re.compile(r'/+')
+
+# 以两个分隔符开头的Windows路径的根（/ 和 \ 可混用），一次匹配即可识别：
+# \\?\Z: 、\\.\Z: （扩展路径中的盘符）、\\?\UNC\主机\共享 及 \\主机\共享；
+# 其他设备路径（如 \\.\pipe\x 、\\?\Volume{...}）不匹配
+_PREFIXED_ROOT = re.compile(
+    r'[\\/]{2}(?:[?.][\\/](?:(?P<drive>[A-Za-z]):(?![^\\/])|(?i:UNC)[\\/])|(?![?.][\\/]))'
+    r'(?(drive)|(?P<host>[^\\/]+)[\\/]+(?P<share>[^\\/]+))'
+)
+
+# 行首盘符（用于整块转换，第一行单独处理）
+_LINE_DRIVE = re.compile(r'\n[A-Za-z]:')
+
+# 不规则行：上一行有尾随空白，或下一行不是以盘符开头（含空行、首部空白）
+_IRREGULAR_LINE = re.compile(r'\n(?:(?<=\s\n)|(?![A-Za-z]:))')
+
+
+# 以下为字节版本，用于直接转换UTF-8编码的数据
+_SLASHES_BYTES = re.compile(rb'/+')
+_LINE_DRIVE_BYTES = re.compile(rb'\n[A-Za-z]:')
+
+# 换行前的空白字符（str.isspace() 为真的字符的UTF-8编码，换行符除外）
+_WS_BEFORE_NEWLINE_BYTES = (
+    rb'(?<=[\t\x0b\x0c\r\x1c-\x1f ]\n)|(?<=\xc2[\x85\xa0]\n)|(?<=\xe1\x9a\x80\n)'
+    rb'|(?<=\xe2\x80[\x80-\x8a\xa8\xa9\xaf]\n)|(?<=\xe2\x81\x9f\n)|(?<=\xe3\x80\x80\n)'
+)
+_IRREGULAR_LINE_BYTES = re.compile(
+    rb'\n(?:' + _WS_BEFORE_NEWLINE_BYTES + rb'|(?![A-Za-z]:|\Z))'
+)
+
+
+@lru_cache(maxsize=None)
+def _other_drive_line(drive):
+    """出现不规则行或其他盘符的行（整块只有一个盘符时走纯字符串替换）"""
+    return re.compile(r'\n(?:(?<=\s\n)|(?!' + drive + ':))')
+
+
+@lru_cache(maxsize=None)
+def _other_drive_line_bytes(drive):
+    """字节版本的 _other_drive_line，数据以换行结尾"""
+    return re.compile(rb'\n(?:' + _WS_BEFORE_NEWLINE_BYTES + rb'|(?!' + drive + rb':|\Z))')
+
+
+def parse_mapping_key(key):
+    """解析路径映射表的键，返回 (类型, 根, 目录层级)
+
+    根为盘符（如 Z: 、z 或 Z:\\Movies）时返回 ('drive', 'Z', ...)，
+    为UNC共享（如 \\\\nas\\media\\Movies）时返回 ('unc', 'nas\\media', ...)；
+    目录层级为小写的各级目录名元组，仅映射根时为空元组。
+    """
+    name = _normalize_key(key)
+    if name.startswith('\\\\'):
+        host, _, rest = name[2:].partition('\\')
+        share, _, rest = rest.partition('\\')
+        if host and share:
+            return 'unc', (host + '\\' + share).lower(), _split_components(rest)
+    elif name and name[0] in string.ascii_letters and name[1:2] in ('', ':'):
+        rest = name[2:]
+        if not rest or rest.startswith('\\'):
+            return 'drive', name[0].upper(), _split_components(rest)
+    raise ValueError(
+        f"无效的映射路径：{key}（应为盘符如 Z: 、共享如 \\\\nas\\share 或其下的目录如 Z:\\Movies）"
+    )
+
+
+def _normalize_key(key):
+    """统一映射表键的分隔符为反斜杠，并去掉扩展路径前缀（\\\\?\\ 、\\\\.\\ 、\\\\?\\UNC\\）"""
+    name = key.strip().replace('/', '\\')
+    if name[:4] in ('\\\\?\\', '\\\\.\\'):
+        name = name[4:]
+        if name[:4].upper() == 'UNC\\':
+            name = '\\\\' + name[4:]
+    return name
+
+
+def _split_components(path):
+    """将反斜杠分隔的路径拆分为小写的目录名元组，忽略空目录名"""
+    return tuple(part.lower() for part in path.split('\\') if part)
+
+
+def format_windows_root(key):
+    """将映射表的键规范为Windows路径写法，如 z -> Z: ，//nas/media/ -> \\\\nas\\media"""
+    kind = parse_mapping_key(key)[0]
+    parts = [part for part in _normalize_key(key).split('\\') if part]
+    if kind == 'drive':
+        return parts[0][0].upper() + ':' + ''.join('\\' + part for part in parts[1:])
+    return '\\\\' + '\\'.join(parts)
+
+
+class _RuleNode:
+    """映射规则树的节点：prefix 为该目录对应的前缀（无规则时为 None），children 为下级目录"""
+    __slots__ = ('prefix', 'children')
+
+    def __init__(self, prefix=None):
+        self.prefix = prefix
+        self.children = {}
+
+
+def _insert_rule(root, components, prefix, replace=True):
+    """向规则树中插入一条目录规则，replace 为 False 时保留已有的规则，返回是否插入"""
+    node = root
+    for component in components:
+        child = node.children.get(component)
+        if child is None:
+            child = node.children[component] = _RuleNode()
+        node = child
+    if node.prefix is not None and not replace:
+        return False
+    node.prefix = prefix
+    return True
+
+
+def _match_longest(root, tail, prefix, fold_case=True):
+    """在规则树中查找与 tail（以 / 分隔）匹配的最长目录规则
+
+    返回 (前缀, 剩余部分, 下级目录)；没有匹配的规则时前两项为传入的前缀和完整的 tail。
+    tail 的每一级目录都在规则树中时，第三项为最后一级目录在规则树中的下级目录
+    （tail 再多一级时可能匹配到更长的规则），否则为 None。
+    fold_case 为真时目录名按小写匹配（Windows路径），否则区分大小写（Linux路径）。
+    查找只沿路径逐级向下，开销与规则数量无关。
+    """
+    matched_end = 0
+    pos = 0
+    length = len(tail)
+    children = root.children
+    while children:
+        while pos < length and tail[pos] == '/':
+            pos += 1
+        if pos >= length:
+            return prefix, tail[matched_end:], children
+        end = tail.find('/', pos)
+        if end == -1:
+            end = length
+        component = tail[pos:end]
+        node = children.get(component.lower() if fold_case else component)
+        if node is None:
+            break
+        if node.prefix is not None:
+            prefix = node.prefix
+            matched_end = end
+        children = node.children
+        pos = end
+    return prefix, tail[matched_end:], None
+
+
+def split_blocks(text, block_size=DEFAULT_BLOCK_SIZE):
+    """将多行文本按大约 block_size 个字符切分为若干块，每块都由完整的行组成"""
+    start = 0
+    length = len(text)
+    while start < length:
+        end = text.find('\n', start + block_size)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end + 1]
+        start = end + 1
+
+
+def pair_lines(block, converted, convert):
+    """将块中的非空行（去掉首尾空白）与整块转换结果的各行配对，返回 (原路径列表, 转换结果列表)
+
+    有非空行的转换结果为空（如映射到空前缀）时行数对不上，此时逐行转换以对齐原路径。
+    """
+    sources = [line.strip() for line in block.split('\n') if line and not line.isspace()]
+    results = converted.split('\n') if converted else []
+    if len(results) != len(sources):
+        pairs = [(source, convert(source)) for source in sources]
+        sources = [source for source, result in pairs if result]
+        results = [result for _, result in pairs if result]
+    return sources, results
+
+
+class PathConverter:
+    """Windows路径与Linux NAS路径双向转换器
+
+    前缀和映射表在构造时固定：每个盘符及UNC共享对应的前缀预先放入查找表，
+    其下的目录规则构建为按目录逐级查找的规则树（最长匹配优先），
+    反向转换使用由同一映射表构建的、按NAS路径逐级查找的规则树，
+    转换时的开销与映射数量无关，同一个实例可被反复调用上百万次。
+    """
+    __slots__ = (
+        '_nas_prefix', '_mappings', '_default_drive', '_drive_prefixes', '_drive_rules',
+        '_unc_prefixes', '_unc_rules', '_has_empty_prefix', '_line_drive_repl',
+        '_drive_prefixes_bytes', '_line_drive_repl_bytes',
+        '_reverse_rules', '_reverse_single', '_reverse_irregular_line',
+        '_cache_size', '_cached_directory',
+    )
+
+    def __init__(self, nas_prefix=DEFAULT_NAS_PREFIX, mappings=None, default_drive=DEFAULT_DRIVE,
+                 cache_size=DEFAULT_CACHE_SIZE):
+        self._nas_prefix = nas_prefix
+        self._mappings = dict(mappings or {})
+        kind, _, components = parse_mapping_key(default_drive)
+        if kind != 'drive' or components:
+            raise ValueError(f"无效的默认盘符：{default_drive}（应为盘符如 Z:）")
+        self._default_drive = format_windows_root(default_drive)
+
+        # 未映射的盘符使用默认前缀；目录规则按根（盘符或共享）分别建树
+        drive_prefixes = dict.fromkeys(string.ascii_uppercase, nas_prefix)
+        unc_prefixes = {}
+        drive_rules = {}
+        unc_rules = {}
+        for key, prefix in self._mappings.items():
+            kind, root, components = parse_mapping_key(key)
+            if not components:
+                (drive_prefixes if kind == 'drive' else unc_prefixes)[root] = prefix
+                continue
+            rules = drive_rules if kind == 'drive' else unc_rules
+            if root not in rules:
+                rules[root] = _RuleNode()
+            _insert_rule(rules[root], components, prefix)
+
+        # 只有目录规则的共享以原路径作为默认结果（见 _convert_prefixed）
+        for root in unc_rules:
+            unc_prefixes.setdefault(root, None)
+
+        # 盘符查找表同时包含大小写，查表即可同时判断是否为盘符
+        self._drive_prefixes = {}
+        for letter, prefix in drive_prefixes.items():
+            self._drive_prefixes[letter] = self._drive_prefixes[letter.lower()] = prefix
+        self._drive_rules = {}
+        for letter, root in drive_rules.items():
+            self._drive_rules[letter] = self._drive_rules[letter.lower()] = root
+        self._unc_prefixes = unc_prefixes
+        self._unc_rules = unc_rules
+        self._drive_prefixes_bytes = {
+            letter.encode('ascii'): prefix.encode('utf-8', errors='surrogateescape')
+            for letter, prefix in self._drive_prefixes.items()
+        }
+        # 前缀为空时单独的盘符行会转换为空行，整块转换需要退回逐行转换
+        self._has_empty_prefix = not all(drive_prefixes.values())
+
+        # 整块替换行首盘符时使用的替换模板：所有盘符前缀相同时使用字符串模板（转义反斜杠），
+        # 否则按匹配到的盘符查表
+        if len(set(drive_prefixes.values())) == 1:
+            self._line_drive_repl = '\n' + drive_prefixes['A'].replace('\\', '\\\\')
+            self._line_drive_repl_bytes = b'\n' + self._drive_prefixes_bytes[b'A'].replace(b'\\', b'\\\\')
+        else:
+            table = {'\n' + letter + ':': '\n' + prefix for letter, prefix in self._drive_prefixes.items()}
+            table_bytes = {
+                b'\n' + letter + b':': b'\n' + prefix for letter, prefix in self._drive_prefixes_bytes.items()
+            }
+            self._line_drive_repl = lambda match: table[match.group()]
+            self._line_drive_repl_bytes = lambda match: table_bytes[match.group()]
+
+        self._build_reverse_rules()
+
+        # 有目录规则时逐行转换需要逐级查找规则树，缓存每个目录的转换结果（LRU），
+        # 同一目录下的路径只需拼接最后一级；没有目录规则时直接转换更快，不使用缓存
+        self._cache_size = cache_size
+        self._cached_directory = None
+        if cache_size and (drive_rules or unc_rules):
+            self._cached_directory = lru_cache(maxsize=cache_size)(self._translate_directory)
+
+    def _build_reverse_rules(self):
+        """由映射表构建反向转换的规则树：NAS路径前缀 -> Windows路径
+
+        多个Windows路径映射到同一前缀时，盘符优先于UNC共享，先出现的优先；
+        默认前缀对应默认盘符（除非已有盘符显式映射到该前缀）。
+        """
+        entries = sorted(self._mappings.items(), key=lambda item: parse_mapping_key(item[0])[0] != 'drive')
+        entries.append((self._default_drive, self._nas_prefix))
+
+        self._reverse_rules = _RuleNode()
+        rules = []
+        for key, prefix in entries:
+            components = tuple(part for part in prefix.split('/') if part)
+            windows_root = format_windows_root(key)
+            if _insert_rule(self._reverse_rules, components, windows_root, replace=False):
+                rules.append((components, windows_root))
+
+        # 只有一条反向规则时，整块反向转换可以直接做字符串替换
+        self._reverse_single = None
+        self._reverse_irregular_line = None
+        if len(rules) == 1:
+            components, windows_root = rules[0]
+            linux_prefix = ''.join('/' + part for part in components)
+            self._reverse_single = (linux_prefix, windows_root)
+            # 不规则行：上一行有尾随空白，或下一行不以该前缀开头
+            if linux_prefix:
+                lookahead = r'(?!' + re.escape(linux_prefix) + r'(?:/|\n|\Z))'
+            else:
+                lookahead = r'(?!/)'
+            self._reverse_irregular_line = re.compile(r'\n(?:(?<=\s\n)|' + lookahead + ')')
+
+    def __repr__(self):
+        return (f"PathConverter(nas_prefix={self._nas_prefix!r}, mappings={self._mappings!r}, "
+                f"default_drive={self._default_drive!r})")
+
+    def __reduce__(self):
+        # 查找表中含有 lambda，序列化时只传递构造参数
+        return self.__class__, (self._nas_prefix, self._mappings, self._default_drive, self._cache_size)
+
+    def cache_info(self):
+        """目录前缀缓存的统计（hits、misses、maxsize、currsize），未使用缓存（没有目录规则）时返回 None"""
+        return self._cached_directory.cache_info() if self._cached_directory is not None else None
+
+    def cache_clear(self):
+        """清空目录前缀缓存及其统计"""
+        if self._cached_directory is not None:
+            self._cached_directory.cache_clear()
+
+    @property
+    def nas_prefix(self):
+        """默认NAS路径前缀（只读）"""
+        return self._nas_prefix
+
+    @property
+    def mappings(self):
+        """路径映射表的副本：盘符或UNC共享 -> NAS路径前缀"""
+        return dict(self._mappings)
+
+    @property
+    def default_drive(self):
+        """反向转换时默认前缀对应的盘符（只读）"""
+        return self._default_drive
+
+    def path_function(self, direction):
+        """返回指定转换方向的单个路径转换函数"""
+        return {
+            TO_LINUX: self.convert,
+            TO_WINDOWS: self.to_windows,
+            AUTO: self.convert_auto,
+        }[direction]
+
+    def block_function(self, direction):
+        """返回指定转换方向的多行文本转换函数"""
+        return {
+            TO_LINUX: self.convert_block,
+            TO_WINDOWS: self.to_windows_block,
+            AUTO: self.convert_auto_block,
+        }[direction]
+
+    def bytes_function(self, direction):
+        """返回指定转换方向的UTF-8数据转换函数"""
+        return {
+            TO_LINUX: self.convert_bytes,
+            TO_WINDOWS: self.to_windows_bytes,
+            AUTO: self.convert_auto_bytes,
+        }[direction]
+
+    def convert(self, windows_path):
+        """转换单个Windows路径为Linux NAS路径"""
+        path = windows_path.strip()
+        if not path:
+            return ""
+
+        # 目录部分查缓存，只拼接最后一级；最后一级可能匹配到更长的目录规则时完整转换
+        if self._cached_directory is not None:
+            cut = max(path.rfind('\\'), path.rfind('/')) + 1
+            if cut:
+                directory, children = self._cached_directory(path[:cut])
+                leaf = path[cut:]
+                if directory is not None and not (children and leaf.lower() in children):
+                    return directory + leaf
+        return self._translate(path)[0]
+
+    __call__ = convert
+
+    def _translate_directory(self, directory):
+        """转换以分隔符结尾的目录（供前缀缓存使用），返回值同 _translate
+
+        目录不含完整的UNC共享根（如 \\\\nas\\ ）时，加上最后一级后才能识别，返回 (None, None)。
+        """
+        if directory[1:2] in ('\\', '/') and directory[0] in ('\\', '/') and not _PREFIXED_ROOT.match(directory):
+            return None, None
+        return self._translate(directory)
+
+    def _translate(self, path):
+        """转换已去除首尾空白的非空路径，返回 (转换结果, 路径末端在规则树中的下级目录或 None)"""
+        # 检查是否为Windows路径格式（盘符 + 冒号），同时查出该盘符的前缀
+        prefix = self._drive_prefixes.get(path[0]) if path[1:2] == ':' else None
+        if prefix is None:
+            if path[1:2] in ('\\', '/') and path[0] in ('\\', '/'):
+                return self._convert_prefixed(path)  # UNC路径或扩展路径
+            return path, None  # 如果不是Windows路径格式，直接返回
+
+        # 移除盘符，反斜杠转为正斜杠，并添加前缀（该盘符下有目录规则时取最长匹配）
+        tail = path[2:].replace('\\', '/')
+        children = None
+        if self._drive_rules:
+            rules = self._drive_rules.get(path[0])
+            if rules is not None:
+                prefix, tail, children = _match_longest(rules, tail, prefix)
+        final_path = prefix + tail
+
+        # 确保路径格式正确，避免双斜杠
+        if '//' in final_path:
+            final_path = _SLASHES.sub('/', final_path)
+
+        return final_path, children
+
+    def _convert_prefixed(self, path):
+        """转换以两个分隔符开头的路径：UNC共享（\\\\主机\\共享\\...）及 \\\\?\\ 、\\\\.\\ 扩展路径
+
+        路径的根由 _PREFIXED_ROOT 一次匹配识别，其余部分与盘符路径相同地查表转换；
+        无法识别的设备路径及未映射的共享原样返回。返回值同 _translate。
+        """
+        match = _PREFIXED_ROOT.match(path)
+        if match is None:
+            return path, None
+
+        drive = match.group('drive')
+        if drive is not None:
+            prefix = self._drive_prefixes[drive]
+            rules = self._drive_rules.get(drive)
+        else:
+            name = (match.group('host') + '\\' + match.group('share')).lower()
+            if name not in self._unc_prefixes:
+                return path, None
+            prefix = self._unc_prefixes[name]
+            rules = self._unc_rules.get(name)
+
+        tail = path[match.end():].replace('\\', '/')
+        children = None
+        if rules is not None:
+            prefix, tail, children = _match_longest(rules, tail, prefix)
+        if prefix is None:
+            return path, children  # 共享本身未映射，且没有匹配的目录规则
+
+        final_path = prefix + tail
+        if '//' in final_path:
+            final_path = _SLASHES.sub('/', final_path)
+        return final_path, children
+
+    def convert_many(self, paths):
+        """按顺序批量转换多个路径，结果与输入一一对应（空行对应空字符串）"""
+        return list(map(self.convert, paths))
+
+    def convert_block(self, text):
+        """转换多行文本，跳过空行，返回以换行连接的结果
+
+        当每一行都是无首尾空白的盘符路径时，整块文本只经过几次
+        字符串替换和正则替换，不再逐行调用 convert；否则退回逐行转换。
+        """
+        result = self._convert_block_fast(text)
+        return self._convert_lines(text, self.convert) if result is None else result
+
+    def _convert_block_fast(self, text):
+        """整块正向转换，不满足整块转换条件时返回 None"""
+        body = text[:-1] if text.endswith('\n') else text
+        if not body:
+            return ""
+
+        # 有目录规则的盘符需要逐行查找规则树
+        drive = body[0]
+        prefix = self._drive_prefixes.get(drive)
+        if (prefix is None or self._has_empty_prefix or body[1:2] != ':'
+                or body[-1].isspace() or drive in self._drive_rules):
+            return None
+
+        if _other_drive_line(drive).search(body) is None:
+            # 所有行同一盘符：只需两次字符串替换
+            result = (prefix + body[2:].replace('\\', '/')
+                      .replace('\n' + drive + ':', '\n' + prefix))
+        elif not self._drive_rules and _IRREGULAR_LINE.search(body) is None:
+            # 多个盘符：第一行直接拼接前缀，其余行通过一次正则替换处理行首盘符
+            result = prefix + body[2:].replace('\\', '/')
+            result = _LINE_DRIVE.sub(self._line_drive_repl, result)
+        else:
+            return None
+
+        # 确保路径格式正确，避免双斜杠
+        if '//' in result:
+            result = _SLASHES.sub('/', result)
+
+        return result
+
+    def convert_bytes(self, data):
+        """转换UTF-8编码的多行数据，跳过空行，返回每行以换行结尾的UTF-8数据
+
+        盘符、冒号、斜杠和换行在UTF-8中都是单字节，且不会出现在多字节字符内部，
+        因此规则的数据块直接在字节上转换，无需解码和编码；否则解码后按文本转换。
+        """
+        if not data:
+            return b''
+        if not data.endswith(b'\n'):
+            data += b'\n'
+
+        # 含回车符时需要按文本模式统一换行符，有目录规则时需要逐行查找规则树，均退回文本转换
+        drive = data[:1]
+        prefix = self._drive_prefixes_bytes.get(drive)
+        if (prefix is None or self._has_empty_prefix or data[1:2] != b':'
+                or b'\r' in data or chr(data[0]) in self._drive_rules):
+            return self._convert_bytes_as_text(data, self.convert_block)
+
+        if _other_drive_line_bytes(drive).search(data) is None:
+            # 所有行同一盘符：只需两次字节替换
+            result = (prefix + data[2:].replace(b'\\', b'/')
+                      .replace(b'\n' + drive + b':', b'\n' + prefix))
+        elif not self._drive_rules and _IRREGULAR_LINE_BYTES.search(data) is None:
+            # 多个盘符：第一行直接拼接前缀，其余行通过一次正则替换处理行首盘符
+            result = prefix + data[2:].replace(b'\\', b'/')
+            result = _LINE_DRIVE_BYTES.sub(self._line_drive_repl_bytes, result)
+        else:
+            return self._convert_bytes_as_text(data, self.convert_block)
+
+        # 确保路径格式正确，避免双斜杠
+        if b'//' in result:
+            result = _SLASHES_BYTES.sub(b'/', result)
+
+        return result
+
+    def to_windows(self, linux_path):
+        """转换单个Linux NAS路径为Windows路径，没有匹配的映射时原样返回"""
+        path = linux_path.strip()
+        if not path:
+            return ""
+        if path[0] != '/':
+            return path  # 如果不是Linux绝对路径，直接返回
+
+        normalized = _SLASHES.sub('/', path) if '//' in path else path
+        windows_root, tail, _ = _match_longest(self._reverse_rules, normalized, self._reverse_rules.prefix,
+                                               fold_case=False)
+        if windows_root is None:
+            return path
+        return windows_root + tail.replace('/', '\\')
+
+    def to_windows_block(self, text):
+        """反向转换多行文本，跳过空行，返回以换行连接的结果"""
+        result = self._to_windows_block_fast(text)
+        return self._convert_lines(text, self.to_windows) if result is None else result
+
+    def _to_windows_block_fast(self, text):
+        """整块反向转换（仅一条反向规则且每行都以该前缀开头），不满足条件时返回 None"""
+        if self._reverse_single is None:
+            return None
+        body = text[:-1] if text.endswith('\n') else text
+        if not body:
+            return ""
+
+        if '//' in body:
+            body = _SLASHES.sub('/', body)
+        linux_prefix, windows_root = self._reverse_single
+        length = len(linux_prefix)
+        if (not body.startswith('/') or not body.startswith(linux_prefix)
+                or body[length:length + 1] not in ('/', '\n', '') or body[-1].isspace()
+                or self._reverse_irregular_line.search(body) is not None):
+            return None
+
+        return (windows_root + body[length:].replace('/', '\\')
+                .replace('\n' + linux_prefix.replace('/', '\\'), '\n' + windows_root))
+
+    def to_windows_bytes(self, data):
+        """反向转换UTF-8编码的多行数据，跳过空行，返回每行以换行结尾的UTF-8数据"""
+        return self._convert_bytes_as_text(data, self.to_windows_block)
+
+    def convert_auto(self, path):
+        """按格式自动识别转换方向：以单个 / 开头的转换为Windows路径，其余（含 //主机/共享）按Windows路径转换"""
+        stripped = path.strip()
+        if stripped[:1] == '/' and stripped[1:2] not in ('/', '\\'):
+            return self.to_windows(stripped)
+        return self.convert(stripped)
+
+    def convert_auto_block(self, text):
+        """按行自动识别方向转换多行文本，跳过空行，返回以换行连接的结果"""
+        result = self._convert_block_fast(text)
+        if result is None and '//' not in text and '/\\' not in text:
+            # 含 // 或 /\ 的行可能是UNC路径（convert_auto 按Windows路径转换），需要逐行识别
+            result = self._to_windows_block_fast(text)
+        return self._convert_lines(text, self.convert_auto) if result is None else result
+
+    def convert_auto_bytes(self, data):
+        """按行自动识别方向转换UTF-8编码的多行数据，跳过空行，返回每行以换行结尾的UTF-8数据"""
+        return self._convert_bytes_as_text(data, self.convert_auto_block)
+
+    def _convert_bytes_as_text(self, data, convert_block):
+        """将UTF-8数据解码后按文本转换，换行符规则与文本模式读取文件一致"""
+        text = data.decode('utf-8', errors='surrogateescape')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        converted = convert_block(text)
+        if not converted:
+            return b''
+        return (converted + '\n').encode('utf-8', errors='surrogateescape')
+
+    @staticmethod
+    def _convert_lines(text, convert):
+        """逐行转换多行文本，跳过空行"""
+        return '\n'.join(filter(None, map(convert, text.split('\n'))))
@@ -0,0 +1,2251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Windows路径转Linux NAS路径转换工具 - PyQt版本
+功能：自动将Windows路径转换为Linux NAS路径
+由 main.py 启动
+作者：Sallos
+"""
+
+# 版本信息
+VERSION = "2.1.0"
+
+import sys
+import json
+import logging
+import os
+import time
+
+from PyQt5.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QLabel, QPlainTextEdit, QPushButton, QGroupBox, QMessageBox,
+    QSplitter, QFrame, QToolButton, QScrollArea, QStackedWidget,
+    QSpinBox, QCheckBox, QProgressBar, QLineEdit, QTableWidget, QTableWidgetItem,
+    QHeaderView, QAbstractItemView, QComboBox, QTableView, QFileDialog, QAction
+)
+from PyQt5.QtCore import Qt, QObject, QThread, QFileSystemWatcher, QTimer, QEvent, pyqtSignal, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QFont, QIcon, QFontMetrics, QKeySequence
+
+from applog import ThrottledDebug, level_from_argv, setup_logging
+from atomicfile import write_text_atomic
+from converter import AUTO, DEFAULT_DRIVE, TO_LINUX, TO_WINDOWS, PathConverter, pair_lines, split_blocks
+
+log = logging.getLogger('nas.gui')
+
+# 窗口缩放、逐块转换等高频事件的调试日志，每种事件每秒最多一条
+throttled_debug = ThrottledDebug(log)
+
+# 可选依赖 pyperclip 在第一次复制时才导入（导入需要二十多毫秒）：尚未导入时为 False，未安装时为 None
+pyperclip = False
+
+def load_pyperclip():
+    """导入 pyperclip，未安装时返回 None"""
+    global pyperclip
+    if pyperclip is False:
+        try:
+            import pyperclip as module
+        except ImportError:
+            module = None
+        pyperclip = module
+    return pyperclip
+
+class CollapsibleGroupBox(QGroupBox):
+    """可折叠的GroupBox"""
+    def __init__(self, title="", parent=None):
+        super().__init__(title, parent)
+        self.setCheckable(True)
+        self.setChecked(False)  # 默认折叠
+        self.toggled.connect(self.on_toggled)
+        self.main_window = None  # 用于引用主窗口
+        
+    def set_main_window(self, main_window):
+        """设置主窗口引用"""
+        self.main_window = main_window
+        
+    def on_toggled(self, checked):
+        """切换显示/隐藏内容"""
+        # 输出点击时的当前窗口大小
+        if self.main_window:
+            current_size = self.main_window.size()
+            log.debug("点击帮助信息按钮 - 状态: %s, 当前窗口大小: %d x %d",
+                      '展开' if checked else '收起', current_size.width(), current_size.height())
+        
+        # 控制窗口大小 - 在改变内容可见性之前处理
+        if self.main_window:
+            if checked:  # 即将展开
+                if not self.main_window.help_expanded:
+                    # 记录当前窗口大小（展开前的大小）
+                    self.main_window.initial_size = self.main_window.size()
+                    self.main_window.help_expanded = True
+                    log.debug("帮助信息即将展开，记录当前窗口大小: %d x %d",
+                              self.main_window.initial_size.width(), self.main_window.initial_size.height())
+            else:  # 即将收起
+                if self.main_window.help_expanded:
+                    log.debug("帮助信息即将收起，当前窗口大小: %d x %d",
+                              self.main_window.size().width(), self.main_window.size().height())
+        
+        # 切换子部件可见性
+        for child in self.findChildren(QWidget):
+            if child != self:
+                child.setVisible(checked)
+        
+        # 在内容变化后调整窗口大小
+        if self.main_window:
+            if not checked:  # 收起后
+                if self.main_window.help_expanded and self.main_window.initial_size:
+                    # 恢复到展开前记录的窗口大小
+                    target_width = self.main_window.initial_size.width()
+                    target_height = self.main_window.initial_size.height()
+                    log.debug("准备恢复到展开前的窗口大小: %d x %d", target_width, target_height)
+                    
+                    # 先设置为固定大小
+                    self.main_window.setFixedSize(target_width, target_height)
+                    log.debug("设置固定大小后窗口大小: %d x %d",
+                              self.main_window.size().width(), self.main_window.size().height())
+                    
+                    # 立即恢复为可调整大小
+                    self.main_window.setMinimumSize(0, 0)
+                    self.main_window.setMaximumSize(16777215, 16777215)  # PyQt的最大值
+                    
+                    self.main_window.help_expanded = False
+                    
+                    # 检查最终大小
+                    final_size = self.main_window.size()
+                    log.debug("帮助信息已收起，最终窗口大小: %d x %d", final_size.width(), final_size.height())
+    
+    def showEvent(self, event):
+        """重写showEvent确保初始状态正确"""
+        super().showEvent(event)
+        # 确保初始状态下内容被隐藏
+        if not self.isChecked():
+            for child in self.findChildren(QWidget):
+                if child != self:
+                    child.setVisible(False)
+
+class ConvertWorker(QThread):
+    """后台转换线程，分块转换并逐块发送结果，避免阻塞界面"""
+    chunk_ready = pyqtSignal(object, object)  # 一块结果：(原路径列表, 转换结果列表)
+    progress_changed = pyqtSignal(int)  # 转换进度（0-100）
+    record_failed = pyqtSignal(str)  # 写入转换历史失败的原因
+    
+    # 每块的大致字符数，块越小界面追加结果时的单次停顿越短
+    BLOCK_SIZE = 1 << 16
+    
+    def __init__(self, convert_block, convert, text, direction, history=None, parent=None):
+        super().__init__(parent)
+        self.convert_block = convert_block
+        self.convert = convert
+        self.text = text
+        self.direction = direction
+        # 指定 history 时把每块的转换结果记录到转换历史
+        self.history = history
+        self.cancelled = False
+        self.line_count = 0  # 已转换的行数
+    
+    def run(self):
+        """转换输入文本，结束时关闭本线程的转换历史数据库连接"""
+        try:
+            self.convert_text()
+        finally:
+            if self.history is not None:
+                self.history.close_thread()
+    
+    def convert_text(self):
+        """按块转换输入文本，每块之间检查是否被取消"""
+        record = None
+        if self.history is not None:
+            from history import HistoryError
+            record = self.history.record
+        total = len(self.text)
+        done = 0
+        for number, block in enumerate(split_blocks(self.text, self.BLOCK_SIZE), 1):
+            if self.isInterruptionRequested():
+                self.cancelled = True
+                return
+            start = time.perf_counter()
+            sources, results = pair_lines(block, self.convert_block(block), self.convert)
+            elapsed = time.perf_counter() - start
+            self.line_count += len(results)
+            throttled_debug('batch', "第 %d 块: %d 行，转换用时 %.2f ms（%.0f 行/秒）",
+                            number, len(results), elapsed * 1000, len(results) / elapsed if elapsed else 0)
+            if results:
+                if record is not None:
+                    try:
+                        record(sources, results, self.direction)
+                    except HistoryError as e:
+                        # 记录失败不影响转换，本次转换的后续结果不再记录
+                        record = None
+                        self.record_failed.emit(str(e))
+                self.chunk_ready.emit(sources, results)
+            done += len(block)
+            self.progress_changed.emit(done * 100 // total)
+
+class FileConvertWorker(QThread):
+    """后台逐个转换文件，结果直接写入输出文件，不经过文本框"""
+    progress_changed = pyqtSignal(int)  # 转换进度（0-100）
+    failed = pyqtSignal(str)  # 读写文件失败的原因
+    
+    def __init__(self, convert_bytes, paths, output, parent=None):
+        super().__init__(parent)
+        self.convert_bytes = convert_bytes
+        self.paths = paths
+        self.output = output
+        self.cancelled = False
+        self.byte_count = 0  # 已转换的输入字节数
+    
+    def run(self):
+        """内存映射读取每个输入文件，按块转换后写入输出文件；取消或失败时删除不完整的输出"""
+        from cli import convert_file_mmap, open_output
+        try:
+            sizes = [os.path.getsize(path) for path in self.paths]
+            out = open_output(self.output)
+        except OSError as e:
+            self.failed.emit(str(e))
+            return
+        total = sum(sizes) or 1
+        done = 0
+        try:
+            with out:
+                for path, size in zip(self.paths, sizes):
+                    def progress(position, done=done):
+                        self.progress_changed.emit((done + position) * 100 // total)
+                        return not self.isInterruptionRequested()
+                    convert_file_mmap(path, out, self.convert_bytes, progress=progress)
+                    if self.isInterruptionRequested():
+                        self.cancelled = True
+                        break
+                    done += size
+                    self.byte_count = done
+        except OSError as e:
+            self.failed.emit(str(e))
+        else:
+            if not self.cancelled:
+                return
+        try:
+            os.remove(self.output)
+        except OSError:
+            pass
+
+class ConfigSaveWorker(QThread):
+    """后台原子写入配置文件，避免在界面线程中等待磁盘"""
+    failed = pyqtSignal(str)  # 写入失败的原因
+    
+    def __init__(self, path, text, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.text = text
+    
+    def run(self):
+        try:
+            write_text_atomic(self.path, self.text)
+        except OSError as e:
+            self.failed.emit(str(e))
+
+class ResultModel(QAbstractTableModel):
+    """转换结果表格：每行为一对（原路径, 转换结果），视图只读取可见的行
+
+    显示转换历史的查询结果时多一列转换时间。
+    """
+    HEADERS = ("原路径", "转换结果")
+    HISTORY_HEADERS = ("原路径", "转换结果", "转换时间")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.sources = []
+        self.results = []
+        self.times = None  # 查询结果的转换时间，None 表示显示的是转换结果
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.results)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers())
+    
+    def headers(self):
+        """当前各列的标题"""
+        return self.HEADERS if self.times is None else self.HISTORY_HEADERS
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            rows = (self.sources, self.results, self.times)[index.column()]
+            return rows[index.row()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers()[section]
+        # 垂直表头显示从 1 开始的行号
+        return super().headerData(section, orientation, role)
+    
+    def set_rows(self, sources, results, times=None):
+        """替换全部结果，指定 times 时显示为转换历史的查询结果"""
+        self.beginResetModel()
+        self.sources = sources
+        self.results = results
+        self.times = times
+        self.endResetModel()
+    
+    def append_rows(self, sources, results):
+        """在末尾追加结果"""
+        if not results:
+            return
+        count = len(self.results)
+        self.beginInsertRows(QModelIndex(), count, count + len(results) - 1)
+        self.sources.extend(sources)
+        self.results.extend(results)
+        self.endInsertRows()
+    
+    def replace_rows(self, start, count, sources, results):
+        """将从第 start 行开始的 count 行替换为新的结果"""
+        # 相同行数的部分直接更新，多出或缺少的部分再插入或删除
+        common = min(count, len(results))
+        if common:
+            self.sources[start:start + common] = sources[:common]
+            self.results[start:start + common] = results[:common]
+            self.dataChanged.emit(self.index(start, 0), self.index(start + common - 1, self.columnCount() - 1))
+        start += common
+        if count > common:
+            self.beginRemoveRows(QModelIndex(), start, start + count - common - 1)
+            del self.sources[start:start + count - common]
+            del self.results[start:start + count - common]
+            self.endRemoveRows()
+        elif len(results) > common:
+            self.beginInsertRows(QModelIndex(), start, start + len(results) - common - 1)
+            self.sources[start:start] = sources[common:]
+            self.results[start:start] = results[common:]
+            self.endInsertRows()
+    
+    def clear(self):
+        """清空结果"""
+        self.set_rows([], [])
+    
+    def converted_text(self):
+        """所有转换结果，每行一个"""
+        return '\n'.join(self.results)
+
+class PathConverterGUI(QMainWindow):
+    # 转换方向：(下拉框显示的文字, 输入框标题)
+    DIRECTION_LABELS = {
+        TO_LINUX: ("Windows → Linux", "输入Windows路径"),
+        TO_WINDOWS: ("Linux → Windows", "输入Linux NAS路径"),
+        AUTO: ("自动识别", "输入路径（按行自动识别方向）"),
+    }
+    
+    # 实时转换时，停止输入多少毫秒后更新结果
+    LIVE_DELAY = 150
+    
+    # 导入的文件合计超过该字节数时不再读入输入框，直接转换到输出文件
+    IMPORT_TEXT_LIMIT = 4 << 20
+    
+    # 拖入文件夹时导入其中这些扩展名的文件（每行整行作为一个路径，CSV等多列格式的文件不在其中）
+    IMPORT_SUFFIXES = ('.txt', '.lst', '.log')
+    
+    # 修改配置后，多少毫秒内没有新的修改才写入配置文件
+    CONFIG_SAVE_DELAY = 500
+    
+    # 配置文件被外部修改后，等待多少毫秒再重新加载（编辑器保存时可能连续触发多次）
+    CONFIG_RELOAD_DELAY = 200
+    
+    def __init__(self):
+        super().__init__()
+        
+        # 配置文件路径
+        self.config_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json')
+        
+        # 保存配置：合并短时间内的多次修改，内容没有变化时不写入，在后台线程中原子写入
+        self.config_saved_text = None  # 最近一次写入（或正在写入）的配置内容
+        self.config_pending_text = None  # 等待写入的配置内容
+        self.config_worker = None
+        self.config_timer = QTimer(self)
+        self.config_timer.setSingleShot(True)
+        self.config_timer.setInterval(self.CONFIG_SAVE_DELAY)
+        self.config_timer.timeout.connect(self.write_pending_config)
+        
+        # 加载配置（必须在UI设置之前）
+        self.load_config()
+        
+        # 创建路径转换器（前缀和映射表在构造时固定）
+        self.converter = self.create_converter()
+        
+        # 监视配置文件，被外部修改后重新加载前缀和映射（监视目录以便发现被替换或重新创建的文件）
+        self.config_reload_timer = QTimer(self)
+        self.config_reload_timer.setSingleShot(True)
+        self.config_reload_timer.setInterval(self.CONFIG_RELOAD_DELAY)
+        self.config_reload_timer.timeout.connect(self.reload_config)
+        self.config_watcher = QFileSystemWatcher(self)
+        self.config_watcher.addPath(os.path.dirname(self.config_file))
+        if os.path.exists(self.config_file):
+            self.config_watcher.addPath(self.config_file)
+        self.config_watcher.fileChanged.connect(self.on_config_file_changed)
+        self.config_watcher.directoryChanged.connect(self.on_config_file_changed)
+        
+        # 转换历史数据库（未开启记录时为 None）
+        self.history = None
+        if self.history_enabled:
+            error = self.open_history()
+            if error:
+                log.warning("%s，已关闭转换历史", error)
+                self.history_enabled = False
+        
+        # 获取DPI缩放比例
+        self.dpi_scale = self.get_dpi_scale()
+        log.debug("DPI缩放比例: %s", self.dpi_scale)
+        
+        # 创建堆叠窗口部件来管理页面
+        self.stacked_widget = QStackedWidget()
+        self.setCentralWidget(self.stacked_widget)
+        
+        # 创建主页面
+        self.main_page = QWidget()
+        self.stacked_widget.addWidget(self.main_page)
+        
+        # 设置页面在第一次打开时才创建，以加快启动
+        self.settings_page = None
+        
+        # 各页面需要缩放字体的控件登记表（第一次调整字体时收集）
+        self.font_registries = {}
+        
+        # 设置主页面为当前页面
+        self.stacked_widget.setCurrentWidget(self.main_page)
+        
+        # 设置窗口属性
+        self.setWindowTitle(f"NAS路径转换工具 v{VERSION}")
+        self.setMinimumSize(900, 700)
+        
+        # 设置UI（其中会应用保存的窗口状态）
+        self.setup_ui()
+        
+        # 状态栏：显示上次转换的行数、用时和速度
+        status_bar = self.statusBar()
+        status_bar.setFont(QFont("Arial", self.scale_font_size(8)))
+        status_bar.setStyleSheet("color: #7f8c8d;")
+        # 状态栏不在页面中，单独登记，字体大小变化时与页面控件一起更新
+        self.font_registries[status_bar] = [(status_bar, 8)]
+        self.convert_started = None
+        
+        # 初始化状态变量
+        self.help_expanded = False
+        self.initial_size = None
+        self.convert_worker = None
+        self.file_worker = None
+        
+        # 实时转换：每行输入的转换结果（空字符串表示该行没有输出），以及尚未处理的修改范围
+        self.live_results = []
+        self.live_dirty_first = None  # 第一个有修改的输入行
+        self.live_dirty_tail = 0  # 末尾未修改的输入行数
+        
+        # 停止输入一段时间后才转换修改过的行
+        self.live_timer = QTimer(self)
+        self.live_timer.setSingleShot(True)
+        self.live_timer.setInterval(self.LIVE_DELAY)
+        self.live_timer.timeout.connect(self.update_live_output)
+        self.input_text.document().contentsChange.connect(self.on_input_changed)
+        if self.live_convert:
+            self.convert_btn.setEnabled(False)
+        
+        # 接受拖入的文件和文件夹（输入框上的文件拖放经由 eventFilter 转交）
+        self.setAcceptDrops(True)
+        self.input_text.viewport().installEventFilter(self)
+    
+    def apply_saved_window_state(self):
+        """应用保存的窗口状态"""
+        try:
+            # 应用保存的帮助信息状态（先设置状态，再调整窗口大小）
+            if hasattr(self, 'saved_help_expanded') and self.saved_help_expanded:
+                # 如果保存时帮助信息是展开的，则展开它
+                if hasattr(self, 'help_group'):
+                    self.help_group.setChecked(True)
+                    self.help_expanded = True
+                    log.debug("应用保存的帮助信息状态: 展开")
+            else:
+                # 确保帮助信息是收起的
+                if hasattr(self, 'help_group'):
+                    self.help_group.setChecked(False)
+                    self.help_expanded = False
+                    log.debug("应用保存的帮助信息状态: 收起")
+            
+            # 强制处理所有待处理的事件
+            QApplication.processEvents()
+            
+            # 应用保存的窗口大小（在状态设置后）
+            if hasattr(self, 'saved_window_width') and hasattr(self, 'saved_window_height'):
+                # 使用保存的窗口大小
+                saved_width = self.saved_window_width
+                saved_height = self.saved_window_height
+                log.debug("应用保存的窗口大小: %sx%s", saved_width, saved_height)
+                
+                # 设置窗口位置和大小
+                self.setGeometry(100, 100, saved_width, saved_height)
+                
+                # 再次强制处理事件并检查最终大小
+                QApplication.processEvents()
+                final_size = self.size()
+                log.debug("最终窗口大小: %dx%d", final_size.width(), final_size.height())
+            else:
+                # 如果没有保存的窗口大小，使用默认大小
+                default_width = self.scale_size(1198)
+                default_height = self.scale_size(1046)
+                log.debug("使用默认窗口大小: %dx%d", default_width, default_height)
+                self.setGeometry(100, 100, default_width, default_height)
+                
+        except Exception as e:
+            log.warning("应用保存的窗口状态时出错: %s", e)
+            # 出错时使用默认大小
+            default_width = self.scale_size(1198)
+            default_height = self.scale_size(1046)
+            self.setGeometry(100, 100, default_width, default_height)
+    
+    def get_dpi_scale(self):
+        """获取DPI缩放比例"""
+        app = QApplication.instance()
+        if app:
+            screen = app.primaryScreen()
+            dpi = screen.logicalDotsPerInch()
+            # 标准DPI为96，计算缩放比例
+            scale = dpi / 96.0
+            return max(1.0, min(scale, 3.0))  # 限制在1.0-3.0之间
+        return 1.0
+    
+    def scale_font_size(self, base_size):
+        """根据DPI缩放和用户设置的字体大小"""
+        # 获取用户设置的字体大小，如果没有设置则使用默认值
+        user_font_size = getattr(self, 'saved_font_size', 9)
+        # 计算字体大小：用户设置的字体大小 + (基础大小 - 9) 的差值，然后应用DPI缩放
+        adjusted_size = user_font_size + (base_size - 9)
+        return int(adjusted_size * self.dpi_scale * 0.6)  # 缩小25%
+    
+    def scale_size(self, base_size):
+        """根据DPI缩放尺寸"""
+        return int(base_size * self.dpi_scale)
+    
+    def scale_button_size(self, base_size):
+        """根据字体大小缩放按钮尺寸"""
+        return int(base_size * self.dpi_scale * 0.6)  # 与字体保持相同的缩放比例
+        
+    def setup_ui(self):
+        """设置用户界面"""
+        # 主布局 - 垂直布局包含标题和内容区域
+        main_layout = QVBoxLayout(self.main_page)
+        main_layout.setSpacing(self.scale_size(15))
+        main_layout.setContentsMargins(self.scale_size(20), self.scale_size(20), 
+                                     self.scale_size(20), self.scale_size(20))
+        
+        # 标题
+        title_label = QLabel("Windows → Linux NAS 路径转换工具")
+        title_label.setAlignment(Qt.AlignCenter)
+        title_label.setFont(QFont("Arial", self.scale_font_size(16), QFont.Bold))
+        title_label.setStyleSheet(f"""
+            QLabel {{
+                color: #2c3e50;
+                padding: {self.scale_size(10)}px;
+                background-color: #ecf0f1;
+                border-radius: {self.scale_size(8)}px;
+                margin-bottom: {self.scale_size(10)}px;
+            }}
+        """)
+        main_layout.addWidget(title_label)
+        
+        # 内容区域 - 水平布局分为左右两列
+        content_layout = QHBoxLayout()
+        content_layout.setSpacing(self.scale_size(20))
+        
+        # 左侧区域 - 输入输出和提示
+        left_widget = QWidget()
+        left_layout = QVBoxLayout(left_widget)
+        left_layout.setSpacing(self.scale_size(15))
+        
+        # 输入区域
+        self.input_group = QGroupBox(self.DIRECTION_LABELS[self.direction][1])
+        self.input_group.setFont(QFont("Arial", self.scale_font_size(10), QFont.Bold))
+        input_layout = QVBoxLayout(self.input_group)
+        
+        self.input_text = QPlainTextEdit()
+        self.input_text.setPlaceholderText("请输入要转换的Windows路径，支持多行输入...\n\n示例：\nI:\\git\\nas目录转换工具\nZ:\\Movies\\动漫\\进击的巨人\\Season 1")
+        self.input_text.setFont(QFont("Consolas", self.scale_font_size(10)))
+        self.input_text.setMinimumHeight(self.scale_size(120))
+        self.input_text.setStyleSheet(f"""
+            QPlainTextEdit {{
+                border: 2px solid #bdc3c7;
+                border-radius: {self.scale_size(8)}px;
+                padding: {self.scale_size(10)}px;
+                background-color: #ffffff;
+                selection-background-color: #3498db;
+            }}
+            QPlainTextEdit:focus {{
+                border-color: #3498db;
+            }}
+        """)
+        input_layout.addWidget(self.input_text)
+        left_layout.addWidget(self.input_group)
+        
+        # 输出区域
+        output_group = QGroupBox("转换结果")
+        output_group.setFont(QFont("Arial", self.scale_font_size(10), QFont.Bold))
+        output_layout = QVBoxLayout(output_group)
+        
+        # 转换历史搜索框（开启记录历史时显示）
+        self.history_search = QLineEdit()
+        self.history_search.setPlaceholderText("🔍 搜索转换历史：输入原路径或转换结果的开头（区分大小写），按回车查询")
+        self.history_search.setFont(QFont("Consolas", self.scale_font_size(10)))
+        self.history_search.setClearButtonEnabled(True)
+        self.history_search.setStyleSheet(f"""
+            QLineEdit {{
+                border: 2px solid #bdc3c7;
+                border-radius: {self.scale_size(8)}px;
+                padding: {self.scale_size(5)}px;
+                background-color: #ffffff;
+            }}
+            QLineEdit:focus {{
+                border-color: #3498db;
+            }}
+        """)
+        self.history_search.returnPressed.connect(self.search_history)
+        self.history_search.setVisible(self.history_enabled)
+        output_layout.addWidget(self.history_search)
+        
+        # 结果表格只绘制可见的行，上百万行也能流畅滚动
+        self.output_model = ResultModel(self)
+        self.output_view = QTableView()
+        self.output_view.setModel(self.output_model)
+        self.output_view.setFont(QFont("Consolas", self.scale_font_size(10)))
+        self.output_view.setMinimumHeight(self.scale_size(120))
+        self.output_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.output_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.output_view.setWordWrap(False)
+        self.output_view.setTextElideMode(Qt.ElideMiddle)
+        self.output_view.setAlternatingRowColors(True)
+        self.output_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # 固定行高，视图无需逐行计算高度
+        row_header = self.output_view.verticalHeader()
+        row_header.setSectionResizeMode(QHeaderView.Fixed)
+        row_header.setDefaultSectionSize(QFontMetrics(self.output_view.font()).height() + self.scale_size(6))
+        self.output_view.setStyleSheet(f"""
+            QTableView {{
+                border: 2px solid #bdc3c7;
+                border-radius: {self.scale_size(8)}px;
+                background-color: #f8f9fa;
+                alternate-background-color: #ffffff;
+                selection-background-color: #3498db;
+            }}
+        """)
+        # Ctrl+C 和右键菜单复制选中各行的转换结果（每行一个），而不只是当前单元格
+        copy_action = QAction("复制选中的转换结果", self.output_view)
+        copy_action.setShortcut(QKeySequence.Copy)
+        copy_action.setShortcutContext(Qt.WidgetWithChildrenShortcut)
+        copy_action.triggered.connect(self.copy_selected_results)
+        self.output_view.addAction(copy_action)
+        self.output_view.setContextMenuPolicy(Qt.ActionsContextMenu)
+        output_layout.addWidget(self.output_view)
+        
+        # 结果行数或提示信息
+        self.output_status = QLabel("转换结果将显示在这里...")
+        self.output_status.setFont(QFont("Arial", self.scale_font_size(8)))
+        self.output_status.setStyleSheet("color: #7f8c8d;")
+        output_layout.addWidget(self.output_status)
+        left_layout.addWidget(output_group)
+        
+        # 规则说明区域
+        # 帮助信息区域 - 可折叠的下拉菜单
+        help_group = CollapsibleGroupBox("📖 帮助信息（点击展开/收起）")
+        help_group.set_main_window(self)  # 设置主窗口引用
+        help_group.setFont(QFont("Arial", self.scale_font_size(9), QFont.Bold))
+        help_layout = QVBoxLayout(help_group)
+        
+        # 转换规则部分
+        rules_title = QLabel("转换规则：")
+        rules_title.setFont(QFont("Arial", self.scale_font_size(9), QFont.Bold))
+        rules_title.setStyleSheet("color: #2c3e50; margin-bottom: 5px;")
+        help_layout.addWidget(rules_title)
+        
+        rules_text = (
+            "• 盘符移除：去掉盘符，直接转换路径\n"
+            "• UNC路径：\\\\主机\\共享、\\\\?\\ 扩展路径按映射转换\n"
+            "• 路径格式：反斜杠 \\ 转为正斜杠 /\n"
+            "• 前缀添加：按设置中的映射添加前缀，目录越具体优先级越高（默认 /share）\n"
+            "• 字符保留：支持中/英/日/韩等字符\n"
+            "• 层级保持：严格保持原路径结构\n"
+            "• 反向转换：NAS前缀还原为对应盘符，/ 转为 \\（自动识别按行判断方向）\n"
+            "• 支持含空格和特殊符号的路径"
+        )
+        
+        rules_label = QLabel(rules_text)
+        rules_label.setFont(QFont("Arial", self.scale_font_size(9)))
+        rules_label.setStyleSheet(f"""
+            QLabel {{
+                color: #34495e;
+                padding: {self.scale_size(10)}px;
+                background-color: #f8f9fa;
+                border-radius: {self.scale_size(6)}px;
+                border-left: {self.scale_size(4)}px solid #3498db;
+                line-height: {self.scale_size(18)}px;
+                margin-bottom: {self.scale_size(10)}px;
+            }}
+        """)
+        help_layout.addWidget(rules_label)
+        
+        # 使用示例部分
+        example_title = QLabel("使用示例：")
+        example_title.setFont(QFont("Arial", self.scale_font_size(9), QFont.Bold))
+        example_title.setStyleSheet("color: #2c3e50; margin-bottom: 5px;")
+        help_layout.addWidget(example_title)
+        
+        example_text = (
+            "输入：I:\\git\\nas目录转换工具\n"
+            "输出：/share/git/nas目录转换工具\n\n"
+            "输入：Z:\\Movies\\动漫\\进击的巨人\\Season 1\n"
+            "输出：/share/Movies/动漫/进击的巨人/Season 1"
+        )
+        
+        example_label = QLabel(example_text)
+        example_label.setFont(QFont("Consolas", self.scale_font_size(9)))
+        example_label.setStyleSheet(f"""
+            QLabel {{
+                color: #2c3e50;
+                padding: {self.scale_size(10)}px;
+                background-color: #f8f9fa;
+                border-radius: {self.scale_size(6)}px;
+                border-left: {self.scale_size(4)}px solid #27ae60;
+                line-height: {self.scale_size(16)}px;
+            }}
+        """)
+        help_layout.addWidget(example_label)
+        
+        left_layout.addWidget(help_group)
+        
+        # 右侧区域 - 按钮竖排
+        right_widget = QWidget()
+        right_widget.setFixedWidth(self.scale_size(180))  # 增加右侧宽度，使用scale_size而不是scale_button_size
+        button_layout = QVBoxLayout(right_widget)
+        button_layout.setSpacing(self.scale_button_size(15))
+        button_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # 转换方向
+        self.direction_combo = QComboBox()
+        for direction, (text, _) in self.DIRECTION_LABELS.items():
+            self.direction_combo.addItem(text, direction)
+        self.direction_combo.setCurrentIndex(self.direction_combo.findData(self.direction))
+        self.direction_combo.setFont(QFont("Arial", self.scale_font_size(10), QFont.Bold))
+        self.direction_combo.setMinimumHeight(self.scale_button_size(50))
+        self.direction_combo.setStyleSheet(f"""
+            QComboBox {{
+                border: 2px solid #bdc3c7;
+                border-radius: {self.scale_size(8)}px;
+                padding: {self.scale_button_size(8)}px;
+                background-color: white;
+            }}
+            QComboBox:focus {{
+                border-color: #3498db;
+            }}
+        """)
+        self.direction_combo.currentIndexChanged.connect(self.on_direction_changed)
+        button_layout.addWidget(self.direction_combo)
+        
+        # 实时转换开关
+        self.live_checkbox = QCheckBox("⚡ 实时转换")
+        self.live_checkbox.setChecked(self.live_convert)
+        self.live_checkbox.setFont(QFont("Arial", self.scale_font_size(10), QFont.Bold))
+        self.live_checkbox.setToolTip("输入时自动转换，只重新转换修改过的行")
+        self.live_checkbox.setStyleSheet(f"""
+            QCheckBox {{
+                color: #2c3e50;
+                spacing: {self.scale_size(8)}px;
+            }}
+            QCheckBox::indicator {{
+                width: {self.scale_size(16)}px;
+                height: {self.scale_size(16)}px;
+            }}
+        """)
+        self.live_checkbox.stateChanged.connect(self.on_live_convert_changed)
+        button_layout.addWidget(self.live_checkbox)
+        
+        # 转换历史开关
+        self.history_checkbox = QCheckBox("🗂️ 记录历史")
+        self.history_checkbox.setChecked(self.history_enabled)
+        self.history_checkbox.setFont(QFont("Arial", self.scale_font_size(10), QFont.Bold))
+        self.history_checkbox.setToolTip("把每次转换的原路径和结果记录到 history.db，可在结果表格上方搜索（实时转换不记录）")
+        self.history_checkbox.setStyleSheet(self.live_checkbox.styleSheet())
+        self.history_checkbox.stateChanged.connect(self.on_history_changed)
+        button_layout.addWidget(self.history_checkbox)
+        
+        # 转换按钮
+        self.convert_btn = QPushButton("🔄 转换路径")
+        self.convert_btn.setFont(QFont("Arial", self.scale_font_size(10), QFont.Bold))
+        self.convert_btn.setMinimumHeight(self.scale_button_size(50))
+        self.convert_btn.setStyleSheet(f"""
+            QPushButton {{
+                background-color: #3498db;
+                color: white;
+                border: none;
+                padding: {self.scale_button_size(12)}px {self.scale_button_size(24)}px;
+                border-radius: {self.scale_size(8)}px;
+                font-weight: bold;
+                min-height: {self.scale_button_size(40)}px;
+            }}
+            QPushButton:hover {{
+                background-color: #2980b9;
+            }}
+            QPushButton:pressed {{
+                background-color: #21618c;
+            }}
+        """)
+        self.convert_btn.clicked.connect(self.convert_paths)
+        button_layout.addWidget(self.convert_btn)
+        
+        # 清空按钮
+        self.clear_btn = QPushButton("🗑️ 清空")
+        self.clear_btn.setFont(QFont("Arial", self.scale_font_size(10), QFont.Bold))
+        self.clear_btn.setMinimumHeight(self.scale_button_size(50))
+        self.clear_btn.setStyleSheet(f"""
+            QPushButton {{
+                background-color: #e74c3c;
+                color: white;
+                border: none;
+                padding: {self.scale_button_size(12)}px {self.scale_button_size(24)}px;
+                border-radius: {self.scale_size(8)}px;
+                font-weight: bold;
+                min-height: {self.scale_button_size(40)}px;
+            }}
+            QPushButton:hover {{
+                background-color: #c0392b;
+            }}
+            QPushButton:pressed {{
+                background-color: #a93226;
+            }}
+        """)
+        self.clear_btn.clicked.connect(self.clear_all)
+        button_layout.addWidget(self.clear_btn)
+        
+        # 复制按钮
+        self.copy_btn = QPushButton("📋 复制结果")
+        self.copy_btn.setFont(QFont("Arial", self.scale_font_size(10), QFont.Bold))
+        self.copy_btn.setMinimumHeight(self.scale_button_size(50))
+        self.copy_btn.setStyleSheet(f"""
+            QPushButton {{
+                background-color: #27ae60;
+                color: white;
+                border: none;
+                padding: {self.scale_button_size(12)}px {self.scale_button_size(24)}px;
+                border-radius: {self.scale_size(8)}px;
+                font-weight: bold;
+                min-height: {self.scale_button_size(40)}px;
+            }}
+            QPushButton:hover {{
+                background-color: #229954;
+            }}
+            QPushButton:pressed {{
+                background-color: #1e8449;
+            }}
+        """)
+        self.copy_btn.clicked.connect(self.copy_result)
+        button_layout.addWidget(self.copy_btn)
+        
+        # 导入文件按钮
+        self.import_btn = QPushButton("📂 导入文件")
+        self.import_btn.setFont(QFont("Arial", self.scale_font_size(10), QFont.Bold))
+        self.import_btn.setMinimumHeight(self.scale_button_size(50))
+        self.import_btn.setToolTip("导入路径列表文件，也可以把文件或文件夹直接拖到窗口上")
+        self.import_btn.setStyleSheet(f"""
+            QPushButton {{
+                background-color: #8e44ad;
+                color: white;
+                border: none;
+                padding: {self.scale_button_size(12)}px {self.scale_button_size(24)}px;
+                border-radius: {self.scale_size(8)}px;
+                font-weight: bold;
+                min-height: {self.scale_button_size(40)}px;
+            }}
+            QPushButton:hover {{
+                background-color: #7d3c98;
+            }}
+            QPushButton:pressed {{
+                background-color: #6c3483;
+            }}
+        """)
+        self.import_btn.clicked.connect(self.choose_import_files)
+        button_layout.addWidget(self.import_btn)
+        
+        # 设置按钮
+        self.settings_btn = QPushButton("⚙️ 设置")
+        self.settings_btn.setFont(QFont("Arial", self.scale_font_size(10), QFont.Bold))
+        self.settings_btn.setMinimumHeight(self.scale_button_size(50))
+        self.settings_btn.setStyleSheet(f"""
+            QPushButton {{
+                background-color: #3498db;
+                color: white;
+                border: none;
+                padding: {self.scale_button_size(12)}px {self.scale_button_size(24)}px;
+                border-radius: {self.scale_size(8)}px;
+                font-weight: bold;
+                min-height: {self.scale_button_size(40)}px;
+            }}
+            QPushButton:hover {{
+                background-color: #2980b9;
+            }}
+            QPushButton:pressed {{
+                background-color: #21618c;
+            }}
+        """)
+        self.settings_btn.clicked.connect(self.show_settings)
+        button_layout.addWidget(self.settings_btn)
+        
+        # 添加底部弹性空间，让按钮向上贴齐
+        button_layout.addStretch()
+        
+        # 转换进度条（仅在转换时显示）
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setFont(QFont("Arial", self.scale_font_size(8)))
+        self.progress_bar.setAlignment(Qt.AlignCenter)
+        self.progress_bar.setVisible(False)
+        button_layout.addWidget(self.progress_bar)
+        
+        # 窗口尺寸显示标签
+        self.size_label = QLabel("窗口尺寸: 900 × 700")
+        self.size_label.setFont(QFont("Arial", self.scale_font_size(8)))
+        self.size_label.setAlignment(Qt.AlignCenter)
+        self.size_label.setStyleSheet(f"""
+            QLabel {{
+                color: #7f8c8d;
+                background-color: #ecf0f1;
+                border: 1px solid #bdc3c7;
+                border-radius: {self.scale_size(4)}px;
+                padding: {self.scale_size(4)}px;
+                margin-top: {self.scale_size(5)}px;
+            }}
+        """)
+        button_layout.addWidget(self.size_label)
+        
+        # 前缀缓存统计标签（命中率）
+        self.cache_label = QLabel()
+        self.cache_label.setFont(QFont("Arial", self.scale_font_size(8)))
+        self.cache_label.setAlignment(Qt.AlignCenter)
+        self.cache_label.setStyleSheet(self.size_label.styleSheet())
+        button_layout.addWidget(self.cache_label)
+        self.update_cache_label()
+        
+        # 将左右区域添加到内容布局
+        content_layout.addWidget(left_widget, 3)  # 左侧占3份
+        content_layout.addWidget(right_widget, 1)  # 右侧占1份
+        
+        # 将内容区域添加到主布局
+        main_layout.addLayout(content_layout)
+        
+        # 设置窗口样式
+        self.setStyleSheet(f"""
+            QMainWindow {{
+                background-color: #ffffff;
+            }}
+            QGroupBox {{
+                font-weight: bold;
+                border: 2px solid #bdc3c7;
+                border-radius: {self.scale_size(8)}px;
+                margin-top: {self.scale_size(10)}px;
+                padding-top: {self.scale_size(10)}px;
+            }}
+            QGroupBox::title {{
+                subcontrol-origin: margin;
+                left: {self.scale_size(10)}px;
+                padding: 0 {self.scale_size(8)}px 0 {self.scale_size(8)}px;
+                color: #2c3e50;
+            }}
+        """)
+        
+        # 初始化窗口尺寸显示
+        self.update_size_label()
+        log.debug("setup_ui完成后窗口大小: %d x %d", self.size().width(), self.size().height())
+        
+        # 应用保存的窗口状态
+        self.apply_saved_window_state()
+        
+    def showEvent(self, event):
+        """窗口显示事件"""
+        super().showEvent(event)
+        size = self.size()
+        pos = self.pos()
+        log.debug("showEvent - 窗口位置: (%d, %d), 大小: %d x %d", pos.x(), pos.y(), size.width(), size.height())
+    
+    def update_size_label(self):
+        """更新窗口尺寸显示"""
+        size = self.size()
+        self.size_label.setText(f"窗口尺寸: {size.width()} × {size.height()}")
+    
+    def update_cache_label(self):
+        """更新前缀缓存的命中统计"""
+        info = self.converter.cache_info()
+        if info is None:
+            self.cache_label.setText("前缀缓存: 未使用")
+            return
+        total = info.hits + info.misses
+        rate = info.hits / total if total else 0.0
+        self.cache_label.setText(f"前缀缓存: 命中 {info.hits} / 未命中 {info.misses}（{rate:.0%}）")
+    
+    def resizeEvent(self, event):
+        """窗口大小改变事件"""
+        super().resizeEvent(event)
+        size = event.size()
+        throttled_debug('resize', "resizeEvent - 新窗口大小: %d x %d", size.width(), size.height())
+        if hasattr(self, 'size_label'):
+            self.update_size_label()
+    
+    def convert_path(self, windows_path):
+        """转换单个Windows路径为Linux NAS路径"""
+        return self.converter.convert(windows_path)
+    
+    def convert_paths(self):
+        """转换所有输入的路径（转换进行中再次点击则取消）"""
+        if self.convert_worker is not None:
+            self.cancel_conversion()
+            return
+        
+        input_content = self.input_text.toPlainText().strip()
+        
+        if not input_content:
+            QMessageBox.warning(self, "警告", "请输入要转换的路径")
+            return
+        
+        # 在后台线程中分块转换，结果逐块追加到结果表格
+        self.output_model.clear()
+        self.output_status.setText("正在转换...")
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.convert_btn.setText("⏹ 取消转换")
+        
+        convert_block = self.converter.block_function(self.direction)
+        convert = self.converter.path_function(self.direction)
+        self.convert_worker = ConvertWorker(convert_block, convert, input_content, self.direction, self.history, self)
+        self.convert_worker.chunk_ready.connect(self.on_chunk_converted)
+        self.convert_worker.record_failed.connect(self.on_record_failed)
+        self.convert_worker.progress_changed.connect(self.progress_bar.setValue)
+        self.convert_worker.finished.connect(self.on_conversion_finished)
+        self.convert_started = time.perf_counter()
+        self.convert_worker.start()
+    
+    def on_direction_changed(self, index):
+        """切换转换方向"""
+        self.direction = self.direction_combo.itemData(index)
+        self.input_group.setTitle(self.DIRECTION_LABELS[self.direction][1])
+        if self.live_convert:
+            self.rebuild_live_output()
+    
+    def on_live_convert_changed(self, state):
+        """切换实时转换"""
+        self.live_convert = state == Qt.Checked
+        self.convert_btn.setEnabled(not self.live_convert)
+        if self.live_convert:
+            self.cancel_conversion(wait=True)
+            self.rebuild_live_output()
+        else:
+            self.live_timer.stop()
+            self.live_dirty_first = None
+        self.save_config()
+    
+    def on_input_changed(self, position, removed, added):
+        """输入框内容变化：记录修改过的行，停止输入后再转换"""
+        if not self.live_convert:
+            return
+        document = self.input_text.document()
+        first = document.findBlock(position).blockNumber()
+        last = document.findBlock(position + added)
+        if not last.isValid():
+            last = document.lastBlock()
+        # 开头和末尾未修改的行数不受其他位置修改的影响，多次修改可以直接合并
+        tail = document.blockCount() - 1 - last.blockNumber()
+        if self.live_dirty_first is None:
+            self.live_dirty_first = first
+            self.live_dirty_tail = tail
+        else:
+            self.live_dirty_first = min(self.live_dirty_first, first)
+            self.live_dirty_tail = min(self.live_dirty_tail, tail)
+        self.live_timer.start()
+    
+    def rebuild_live_output(self):
+        """重新转换全部输入（开启实时转换、切换方向或修改映射后）"""
+        self.live_timer.stop()
+        self.live_dirty_first = None
+        start = time.perf_counter()
+        convert = self.converter.path_function(self.direction)
+        lines = self.input_text.toPlainText().split('\n')
+        self.live_results = list(map(convert, lines))
+        sources = [line.strip() for line, result in zip(lines, self.live_results) if result]
+        self.output_model.set_rows(sources, list(filter(None, self.live_results)))
+        self.update_output_status()
+        self.update_cache_label()
+        self.show_timing("实时转换（全部）", len(lines), time.perf_counter() - start, throttle=True)
+    
+    def update_live_output(self):
+        """只转换修改过的输入行，并替换输出框中对应的行"""
+        first = self.live_dirty_first
+        if first is None:
+            return
+        if self.output_model.times is not None:
+            # 结果表格正在显示历史查询结果，重新显示全部转换结果
+            self.rebuild_live_output()
+            return
+        self.live_dirty_first = None
+        started = time.perf_counter()
+        document = self.input_text.document()
+        results = self.live_results
+        block_count = document.blockCount()
+        tail = min(self.live_dirty_tail, block_count - first, len(results) - first)
+        
+        convert = self.converter.path_function(self.direction)
+        new_results = []
+        sources = []
+        block = document.findBlockByNumber(first)
+        for _ in range(block_count - tail - first):
+            result = convert(block.text())
+            new_results.append(result)
+            if result:
+                sources.append(block.text().strip())
+            block = block.next()
+        
+        # 之前各行的非空结果数即为被替换部分在结果表格中的起始行
+        end = len(results) - tail
+        old_results = results[first:end]
+        start = first - results[:first].count('')
+        self.output_model.replace_rows(start, len(old_results) - old_results.count(''),
+                                       sources, list(filter(None, new_results)))
+        results[first:end] = new_results
+        self.update_output_status()
+        self.update_cache_label()
+        self.show_timing("实时转换", len(new_results), time.perf_counter() - started, throttle=True)
+    
+    def cancel_conversion(self, wait=False):
+        """取消正在进行的转换"""
+        worker = self.convert_worker
+        if worker is None:
+            return
+        worker.requestInterruption()
+        if wait:
+            worker.wait()
+        # 线程已结束、只剩结束信号尚未处理时，直接结束本次转换
+        if worker.isFinished():
+            self.finish_conversion(cancelled=True)
+    
+    def on_chunk_converted(self, sources, results):
+        """收到一块转换结果，追加到结果表格末尾"""
+        # 已取消的转换可能仍有排队中的结果，直接丢弃
+        if self.convert_worker is None or self.convert_worker.isInterruptionRequested():
+            return
+        self.output_model.append_rows(sources, results)
+        self.update_output_status()
+    
+    def on_conversion_finished(self):
+        """后台转换线程结束"""
+        if self.convert_worker is None:
+            return
+        cancelled = self.convert_worker.cancelled or self.convert_worker.isInterruptionRequested()
+        self.finish_conversion(cancelled)
+    
+    def finish_conversion(self, cancelled):
+        """结束本次转换，恢复界面状态"""
+        worker = self.convert_worker
+        self.convert_worker = None
+        worker.deleteLater()
+        
+        self.progress_bar.setVisible(False)
+        self.convert_btn.setText("🔄 转换路径")
+        self.update_cache_label()
+        if cancelled:
+            self.update_output_status("转换已取消")
+            return
+        self.show_timing("转换", worker.line_count, time.perf_counter() - self.convert_started)
+        
+        # 显示结果
+        if self.output_model.rowCount():
+            self.update_output_status()
+            
+            # 自动复制结果到剪贴板
+            self.copy_to_clipboard(self.output_model.converted_text())
+        else:
+            self.update_output_status("没有找到有效的路径格式")
+    
+    def show_timing(self, what, lines, elapsed, throttle=False):
+        """在状态栏和日志中显示一次转换的行数、用时和速度（throttle 为真时使用限频的调试日志）"""
+        rate = lines / elapsed if elapsed else 0
+        if throttle:
+            throttled_debug(what, "%s: %d 行，用时 %.2f ms（%.0f 行/秒）", what, lines, elapsed * 1000, rate)
+        else:
+            log.info("%s: %d 行，用时 %.3f 秒（%.0f 行/秒）", what, lines, elapsed, rate)
+        self.statusBar().showMessage(f"上次{what}: {lines} 行，用时 {elapsed * 1000:.0f} ms（{rate:,.0f} 行/秒）")
+    
+    def update_output_status(self, message=None):
+        """在结果表格下方显示结果行数，或显示 message"""
+        if message is None:
+            count = self.output_model.rowCount()
+            message = f"共 {count} 行" if count else "转换结果将显示在这里..."
+        self.output_status.setText(message)
+    
+    def clear_all(self):
+        """清空所有文本框"""
+        self.cancel_conversion()
+        self.input_text.clear()
+        self.output_model.clear()
+        self.update_output_status()
+        if self.live_convert:
+            self.rebuild_live_output()
+    
+    def copy_result(self):
+        """复制转换结果到剪贴板"""
+        result = self.output_model.converted_text()
+        if result:
+            self.copy_to_clipboard(result)
+            QMessageBox.information(self, "提示", "结果已复制到剪贴板")
+        else:
+            QMessageBox.warning(self, "警告", "没有可复制的内容")
+    
+    def copy_selected_results(self):
+        """复制结果表格中选中各行的转换结果，每行一个，按行号顺序"""
+        rows = set()
+        for selected in self.output_view.selectionModel().selection():
+            rows.update(range(selected.top(), selected.bottom() + 1))
+        if rows:
+            results = self.output_model.results
+            self.copy_to_clipboard('\n'.join(results[row] for row in sorted(rows)))
+    
+    def copy_to_clipboard(self, text):
+        """复制文本到剪贴板"""
+        try:
+            if load_pyperclip():
+                pyperclip.copy(text)
+            else:
+                # 使用PyQt的剪贴板
+                clipboard = QApplication.clipboard()
+                clipboard.setText(text)
+        except Exception as e:
+            QMessageBox.warning(self, "错误", f"复制到剪贴板失败：{str(e)}")
+    
+    def choose_import_files(self):
+        """选择要导入的路径列表文件（导出进行中再次点击则取消）"""
+        if self.file_worker is not None:
+            self.file_worker.requestInterruption()
+            return
+        paths, _ = QFileDialog.getOpenFileNames(
+            self, "选择路径列表文件", "", "路径列表 (*.txt *.lst *.log);;所有文件 (*)")
+        if paths:
+            self.import_files(paths)
+    
+    def dragEnterEvent(self, event):
+        """拖入本地文件或文件夹时接受"""
+        if self.dropped_paths(event.mimeData()):
+            event.acceptProposedAction()
+        else:
+            super().dragEnterEvent(event)
+    
+    def dropEvent(self, event):
+        """放下文件或文件夹后导入"""
+        paths = self.dropped_paths(event.mimeData())
+        if not paths:
+            super().dropEvent(event)
+            return
+        event.acceptProposedAction()
+        self.import_files(paths)
+    
+    def eventFilter(self, obj, event):
+        """输入框收到的文件拖放交给主窗口处理，文本拖放保持原样"""
+        if event.type() in (QEvent.DragEnter, QEvent.DragMove, QEvent.Drop) and self.dropped_paths(event.mimeData()):
+            if event.type() == QEvent.Drop:
+                self.dropEvent(event)
+            else:
+                event.acceptProposedAction()
+            return True
+        return super().eventFilter(obj, event)
+    
+    @staticmethod
+    def dropped_paths(mime_data):
+        """拖放数据中的本地文件和文件夹路径"""
+        if not mime_data.hasUrls():
+            return []
+        return [url.toLocalFile() for url in mime_data.urls() if url.isLocalFile()]
+    
+    def expand_import_paths(self, paths):
+        """展开文件夹：返回其中（含子文件夹）扩展名为路径列表格式的文件，直接选择的文件保持原样"""
+        files = []
+        for path in paths:
+            if not os.path.isdir(path):
+                files.append(path)
+                continue
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                files.extend(os.path.join(root, name) for name in sorted(names)
+                             if os.path.splitext(name)[1].lower() in self.IMPORT_SUFFIXES)
+        return files
+    
+    def import_files(self, paths):
+        """导入文件：较小时读入输入框转换，超过 IMPORT_TEXT_LIMIT 时直接转换到输出文件"""
+        if self.file_worker is not None:
+            QMessageBox.warning(self, "警告", "正在导出文件，请等待完成或取消后再导入")
+            return
+        try:
+            files = self.expand_import_paths(paths)
+            total = sum(os.path.getsize(path) for path in files)
+        except OSError as e:
+            QMessageBox.warning(self, "错误", f"读取文件失败：{e}")
+            return
+        if not files:
+            QMessageBox.warning(self, "警告", "没有找到可导入的文件")
+            return
+        
+        if total <= self.IMPORT_TEXT_LIMIT:
+            try:
+                contents = []
+                for path in files:
+                    with open(path, 'r', encoding='utf-8-sig', errors='replace') as f:
+                        contents.append(f.read().rstrip('\n'))
+            except OSError as e:
+                QMessageBox.warning(self, "错误", f"读取文件失败：{e}")
+                return
+            self.cancel_conversion(wait=True)
+            self.input_text.setPlainText('\n'.join(contents))
+            # 实时转换时输入框的变化会自动转换
+            if not self.live_convert:
+                self.convert_paths()
+            return
+        
+        base, _ = os.path.splitext(files[0])
+        output, _ = QFileDialog.getSaveFileName(
+            self, f"文件较大（{total / (1 << 20):.1f} MB），选择转换结果的保存位置",
+            base + ".converted.txt", "文本文件 (*.txt);;所有文件 (*)")
+        if not output:
+            return
+        # 按文件本身比较（符号链接、硬链接、大小写不敏感的文件系统上的不同写法都算同一个文件）
+        from cli import is_same_file
+        if any(is_same_file(path, output) for path in files):
+            QMessageBox.warning(self, "警告", "保存位置不能是要导入的文件")
+            return
+        self.start_file_conversion(files, output)
+    
+    def start_file_conversion(self, files, output):
+        """在后台线程中把文件直接转换到输出文件"""
+        self.cancel_conversion(wait=True)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.import_btn.setText("⏹ 取消导出")
+        self.convert_btn.setEnabled(False)
+        self.update_output_status(f"正在转换 {len(files)} 个文件到 {output} ...")
+        
+        self.file_worker = FileConvertWorker(self.converter.bytes_function(self.direction), files, output, self)
+        self.file_worker.progress_changed.connect(self.progress_bar.setValue)
+        self.file_worker.failed.connect(self.on_file_conversion_failed)
+        self.file_worker.finished.connect(self.on_file_conversion_finished)
+        self.convert_started = time.perf_counter()
+        self.file_worker.start()
+    
+    def on_file_conversion_failed(self, message):
+        """文件转换失败"""
+        QMessageBox.warning(self, "错误", f"转换文件失败：{message}")
+    
+    def on_file_conversion_finished(self):
+        """文件转换线程结束，恢复界面状态"""
+        worker = self.file_worker
+        self.file_worker = None
+        worker.deleteLater()
+        
+        self.progress_bar.setVisible(False)
+        self.import_btn.setText("📂 导入文件")
+        self.convert_btn.setEnabled(not self.live_convert)
+        self.update_cache_label()
+        if worker.cancelled:
+            self.update_output_status("导出已取消")
+        elif os.path.exists(worker.output):
+            elapsed = time.perf_counter() - self.convert_started
+            megabytes = worker.byte_count / (1 << 20)
+            log.info("导出: %d 个文件 %.1f MB，用时 %.3f 秒（%.1f MB/秒）",
+                     len(worker.paths), megabytes, elapsed, megabytes / elapsed if elapsed else 0)
+            self.statusBar().showMessage(
+                f"上次导出: {megabytes:.1f} MB，用时 {elapsed:.2f} 秒（{megabytes / elapsed if elapsed else 0:.1f} MB/秒）")
+            self.update_output_status(f"已将 {len(worker.paths)} 个文件的转换结果写入 {worker.output}")
+            QMessageBox.information(self, "转换完成", f"转换结果已保存到：\n{worker.output}")
+        else:
+            self.update_output_status("导出失败")
+    
+    def open_history(self):
+        """打开转换历史数据库，失败时返回原因（用到时才导入 history 和 sqlite3）"""
+        from history import DEFAULT_HISTORY_FILE, ConversionHistory, HistoryError
+        try:
+            self.history = ConversionHistory(DEFAULT_HISTORY_FILE)
+        except HistoryError as e:
+            return str(e)
+        return None
+    
+    def on_history_changed(self, state):
+        """切换是否记录转换历史"""
+        if state == Qt.Checked:
+            error = self.open_history()
+            if error:
+                QMessageBox.warning(self, "错误", error)
+                self.history_checkbox.setChecked(False)
+                return
+        else:
+            self.close_history()
+        self.history_enabled = self.history is not None
+        self.history_search.setVisible(self.history_enabled)
+        self.save_config()
+    
+    def close_history(self):
+        """关闭转换历史数据库"""
+        history, self.history = self.history, None
+        if history is None:
+            return
+        if self.convert_worker is not None:
+            # 正在进行的转换仍在记录，线程结束后再关闭
+            self.convert_worker.finished.connect(history.close)
+        else:
+            history.close()
+    
+    def on_record_failed(self, message):
+        """写入转换历史失败"""
+        QMessageBox.warning(self, "错误", f"{message}\n本次转换的其余结果不再记录")
+    
+    def search_history(self):
+        """在转换历史中查找原路径或转换结果以搜索框内容开头的记录，显示在结果表格中"""
+        text = self.history_search.text().strip()
+        if self.history is None or not text:
+            return
+        from history import HistoryError
+        self.cancel_conversion(wait=True)
+        start = time.perf_counter()
+        try:
+            entries = self.history.search(text)
+        except HistoryError as e:
+            QMessageBox.warning(self, "错误", str(e))
+            return
+        elapsed = time.perf_counter() - start
+        
+        def format_time(timestamp):
+            return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+        
+        self.live_timer.stop()
+        self.output_model.set_rows(
+            [entry.source for entry in entries],
+            [entry.target for entry in entries],
+            [f"{format_time(entry.last_seen)}（共 {entry.count} 次，首次 {format_time(entry.first_seen)}）"
+             for entry in entries])
+        self.update_output_status(f"转换历史中找到 {len(entries)} 条记录（用时 {elapsed * 1000:.1f} 毫秒）")
+    
+    def closeEvent(self, event):
+        """程序关闭时保存配置"""
+        # 停止后台转换线程
+        self.cancel_conversion(wait=True)
+        if self.file_worker is not None:
+            self.file_worker.requestInterruption()
+            self.file_worker.wait()
+        self.close_history()
+        
+        # 保存当前窗口状态，并立即写入尚未写入的配置
+        self.save_config()
+        self.flush_config()
+        
+        # 调用父类的closeEvent
+        super().closeEvent(event)
+    
+    def load_config(self):
+        """加载配置文件"""
+        default_config = {
+            "nas_prefix": "/share",
+            "path_mappings": {},  # 盘符或UNC共享 -> NAS路径前缀
+            "default_drive": DEFAULT_DRIVE,  # 反向转换时默认前缀对应的盘符
+            "direction": TO_LINUX,  # 转换方向
+            "live_convert": False,  # 是否边输入边转换
+            "history_enabled": False,  # 是否记录转换历史
+            "window_width": 1249,
+            "window_height": 1046,
+            "help_expanded": False,
+            "font_size": 9,  # 默认字体大小
+            "auto_resize": False  # 是否自动调整界面大小
+        }
+        
+        try:
+            if os.path.exists(self.config_file):
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
+                    # 配置与文件中相同时无需再写入
+                    self.config_saved_text = json.dumps(config, ensure_ascii=False, indent=4)
+                    self.nas_prefix = config.get('nas_prefix', default_config['nas_prefix'])
+                    self.path_mappings = config.get('path_mappings', default_config['path_mappings'])
+                    self.default_drive = config.get('default_drive', default_config['default_drive'])
+                    self.direction = config.get('direction', default_config['direction'])
+                    # 未知的转换方向（包括不是字符串的值）使用默认方向
+                    if not isinstance(self.direction, str) or self.direction not in self.DIRECTION_LABELS:
+                        self.direction = default_config['direction']
+                    # 开关类设置不是布尔值时使用默认值
+                    self.live_convert = config.get('live_convert', default_config['live_convert'])
+                    if not isinstance(self.live_convert, bool):
+                        self.live_convert = default_config['live_convert']
+                    self.history_enabled = config.get('history_enabled', default_config['history_enabled'])
+                    if not isinstance(self.history_enabled, bool):
+                        self.history_enabled = default_config['history_enabled']
+                    # 读取窗口大小和帮助信息状态
+                    self.saved_window_width = config.get('window_width', default_config['window_width'])
+                    self.saved_window_height = config.get('window_height', default_config['window_height'])
+                    self.saved_help_expanded = config.get('help_expanded', default_config['help_expanded'])
+                    # 读取设置页面配置
+                    self.saved_font_size = config.get('font_size', default_config['font_size'])
+                    self.saved_auto_resize = config.get('auto_resize', default_config['auto_resize'])
+                    log.debug("从配置文件读取: 窗口大小 %sx%s, 帮助信息展开: %s, 字体大小: %s, 自动调整: %s",
+                              self.saved_window_width, self.saved_window_height, self.saved_help_expanded,
+                              self.saved_font_size, self.saved_auto_resize)
+            else:
+                # 创建默认配置文件
+                self.nas_prefix = default_config['nas_prefix']
+                self.path_mappings = default_config['path_mappings']
+                self.default_drive = default_config['default_drive']
+                self.direction = default_config['direction']
+                self.live_convert = default_config['live_convert']
+                self.history_enabled = default_config['history_enabled']
+                self.saved_window_width = default_config['window_width']
+                self.saved_window_height = default_config['window_height']
+                self.saved_help_expanded = default_config['help_expanded']
+                self.saved_font_size = default_config['font_size']
+                self.saved_auto_resize = default_config['auto_resize']
+                self.save_config(default_config)
+                self.write_pending_config()
+                log.info("配置文件不存在，已创建默认配置: %s", self.config_file)
+        except Exception as e:
+            # 如果配置文件损坏，使用默认配置并重新创建文件
+            log.warning("配置文件 %s 损坏（%s），已重置为默认配置", self.config_file, e)
+            self.nas_prefix = default_config['nas_prefix']
+            self.path_mappings = default_config['path_mappings']
+            self.default_drive = default_config['default_drive']
+            self.direction = default_config['direction']
+            self.live_convert = default_config['live_convert']
+            self.history_enabled = default_config['history_enabled']
+            self.saved_window_width = default_config['window_width']
+            self.saved_window_height = default_config['window_height']
+            self.saved_help_expanded = default_config['help_expanded']
+            self.saved_font_size = default_config['font_size']
+            self.saved_auto_resize = default_config['auto_resize']
+            self.save_config(default_config)
+            self.write_pending_config()
+    
+    def save_config(self, config=None):
+        """保存配置文件：停止修改 CONFIG_SAVE_DELAY 毫秒后在后台写入，内容与已写入的相同时不写入"""
+        # 如果没有传入config，则创建当前状态的配置
+        if config is None:
+            current_size = self.size()
+            config = {
+                "nas_prefix": self.nas_prefix,
+                "path_mappings": getattr(self, 'path_mappings', {}),
+                "default_drive": getattr(self, 'default_drive', DEFAULT_DRIVE),
+                "direction": getattr(self, 'direction', TO_LINUX),
+                "live_convert": getattr(self, 'live_convert', False),
+                "history_enabled": getattr(self, 'history_enabled', False),
+                "window_width": current_size.width(),
+                "window_height": current_size.height(),
+                "help_expanded": getattr(self, 'help_expanded', False),
+                "font_size": getattr(self, 'saved_font_size', 9),
+                "auto_resize": getattr(self, 'saved_auto_resize', False)
+            }
+        
+        text = json.dumps(config, ensure_ascii=False, indent=4)
+        if text == self.config_saved_text:
+            # 与已写入的内容相同（或修改后又改了回去），取消等待中的写入
+            self.config_pending_text = None
+            self.config_timer.stop()
+            return
+        log.debug("保存当前配置: 窗口大小 %sx%s, 帮助信息展开: %s, 字体大小: %s, 自动调整: %s",
+                  config['window_width'], config['window_height'], config['help_expanded'],
+                  config['font_size'], config['auto_resize'])
+        self.config_pending_text = text
+        self.config_timer.start()
+    
+    def write_pending_config(self):
+        """在后台线程中写入等待中的配置（上一次写入尚未完成时，完成后再写入）"""
+        if self.config_pending_text is None or self.config_worker is not None:
+            return
+        text, self.config_pending_text = self.config_pending_text, None
+        self.config_saved_text = text
+        self.config_worker = ConfigSaveWorker(self.config_file, text, self)
+        self.config_worker.failed.connect(self.on_config_save_failed)
+        self.config_worker.finished.connect(self.on_config_saved)
+        self.config_worker.start()
+    
+    def on_config_saved(self):
+        """配置写入线程结束，写入期间又有修改时继续写入"""
+        worker = self.config_worker
+        self.config_worker = None
+        worker.deleteLater()
+        if not self.config_timer.isActive():
+            self.write_pending_config()
+    
+    def on_config_save_failed(self, message):
+        """写入配置文件失败：下次保存时重新写入"""
+        self.config_saved_text = None
+        QMessageBox.critical(self, "错误", f"保存配置文件失败：{message}")
+    
+    def flush_config(self):
+        """等待后台写入完成，并立即写入等待中的配置（程序关闭时）"""
+        self.config_timer.stop()
+        if self.config_worker is not None:
+            self.config_worker.wait()
+        if self.config_pending_text is None:
+            return
+        try:
+            write_text_atomic(self.config_file, self.config_pending_text)
+            self.config_saved_text, self.config_pending_text = self.config_pending_text, None
+            log.debug("程序关闭时已保存配置")
+        except OSError as e:
+            log.warning("保存配置时出错: %s", e)
+    
+    def on_config_file_changed(self, path):
+        """配置文件或其所在目录有变化：重新监视被替换的文件，稍后重新加载"""
+        if os.path.exists(self.config_file) and self.config_file not in self.config_watcher.files():
+            # 原子替换（包括本程序自己的写入）后原文件已不存在，需要重新监视
+            self.config_watcher.addPath(self.config_file)
+        elif path != self.config_file:
+            return
+        self.config_reload_timer.start()
+    
+    def reload_config(self):
+        """配置文件被修改后重新读取前缀和映射，一次性创建新的转换器后替换
+
+        已开始的转换在启动时就取得了旧转换器的转换函数，会用旧规则完成；之后的转换使用新规则。
+        读取或解析失败时保留当前配置；只有映射无效时保留当前映射，其他设置仍然生效。
+        """
+        try:
+            with open(self.config_file, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except (OSError, ValueError) as e:
+            log.warning("重新加载配置文件失败，继续使用当前配置: %s", e)
+            return
+        if not isinstance(config, dict):
+            log.warning("配置文件格式无效，继续使用当前配置")
+            return
+        text = json.dumps(config, ensure_ascii=False, indent=4)
+        if text == self.config_saved_text:
+            return  # 本程序自己写入的内容
+        self.config_saved_text = text
+        
+        nas_prefix = config.get('nas_prefix', self.nas_prefix)
+        mappings = config.get('path_mappings') or {}
+        default_drive = config.get('default_drive', self.default_drive)
+        converter = None
+        mappings_valid = True
+        if (nas_prefix, mappings, default_drive) != (self.nas_prefix, self.path_mappings, self.default_drive):
+            try:
+                converter = PathConverter(nas_prefix, mappings, default_drive)
+            except (ValueError, AttributeError, TypeError) as e:
+                log.warning("配置文件中的路径映射无效，继续使用当前映射: %s", e)
+                self.statusBar().showMessage("配置文件中的路径映射无效，继续使用当前映射")
+                mappings_valid = False
+        if converter is not None:
+            self.nas_prefix = nas_prefix
+            self.path_mappings = mappings
+            self.default_drive = converter.default_drive
+            self.converter = converter
+            self.refresh_mapping_settings()
+            if self.live_convert:
+                self.rebuild_live_output()
+            self.update_cache_label()
+            log.info("配置文件已修改，已重新加载 %d 条路径映射", len(mappings))
+            self.statusBar().showMessage(f"配置文件已修改，已重新加载 {len(mappings)} 条路径映射")
+        self.apply_reloaded_settings(config)
+        if not mappings_valid:
+            # 不用当前映射立即覆盖文件中无效的映射，留给用户修正
+            self.config_pending_text = None
+            self.config_timer.stop()
+    
+    def apply_reloaded_settings(self, config):
+        """应用配置文件中被外部修改的其他设置，之后保存配置时不会再用旧值覆盖
+
+        无效的值保持当前设置。
+        """
+        direction = config.get('direction', self.direction)
+        if isinstance(direction, str) and direction != self.direction and direction in self.DIRECTION_LABELS:
+            self.direction_combo.setCurrentIndex(self.direction_combo.findData(direction))
+        
+        live_convert = config.get('live_convert', self.live_convert)
+        if isinstance(live_convert, bool) and live_convert != self.live_convert:
+            self.live_checkbox.setChecked(live_convert)
+        
+        history_enabled = config.get('history_enabled', self.history_enabled)
+        if isinstance(history_enabled, bool) and history_enabled != self.history_enabled:
+            self.history_checkbox.setChecked(history_enabled)
+        
+        auto_resize = config.get('auto_resize', self.saved_auto_resize)
+        if isinstance(auto_resize, bool) and auto_resize != self.saved_auto_resize:
+            self.saved_auto_resize = auto_resize
+            if self.settings_page is not None:
+                # 只同步选项，不立即调整窗口大小
+                self.auto_resize_checkbox.blockSignals(True)
+                self.auto_resize_checkbox.setChecked(auto_resize)
+                self.auto_resize_checkbox.blockSignals(False)
+        
+        font_size = config.get('font_size', self.saved_font_size)
+        if isinstance(font_size, int) and 8 <= font_size <= 20 and font_size != self.saved_font_size:
+            self.saved_font_size = font_size
+            if self.settings_page is not None:
+                self.font_size_spinbox.setValue(font_size)
+            self.update_all_fonts()
+        
+        width = config.get('window_width', self.width())
+        height = config.get('window_height', self.height())
+        if isinstance(width, int) and isinstance(height, int) and (width, height) != (self.width(), self.height()):
+            self.resize(width, height)
+        
+        # 等待中的保存是按旧配置生成的，按新的界面状态重新生成，避免覆盖外部的修改；
+        # 界面状态与配置文件一致时不会写入，被窗口最小尺寸等限制修正过的值会写回配置文件
+        self.save_config()
+    
+    def refresh_mapping_settings(self):
+        """设置页面已创建时，按当前配置刷新前缀和映射表"""
+        if self.settings_page is None:
+            return
+        self.nas_prefix_edit.setText(self.nas_prefix)
+        self.default_drive_edit.setText(self.default_drive)
+        self.mapping_table.setRowCount(0)
+        for source, prefix in self.path_mappings.items():
+            self.add_mapping_row(source, prefix)
+    
+    def create_converter(self):
+        """根据当前前缀和映射表创建转换器
+
+        配置无效时依次忽略盘符、映射表和前缀，改用默认值，并把实际使用的值写回当前配置。
+        """
+        attempts = (
+            (self.nas_prefix, self.path_mappings, self.default_drive),
+            (self.nas_prefix, self.path_mappings),
+            (self.nas_prefix,),
+            (),
+        )
+        error = None
+        for args in attempts:
+            try:
+                converter = PathConverter(*args)
+                break
+            except (ValueError, AttributeError, TypeError) as e:
+                error = error or e
+        if error is not None:
+            log.warning("路径映射配置无效，已改用默认值: %s", error)
+        self.nas_prefix = converter.nas_prefix
+        self.path_mappings = converter.mappings
+        self.default_drive = converter.default_drive
+        return converter
+    
+    def create_settings_page(self):
+        """创建设置页面"""
+        # 设置页面主布局
+        settings_layout = QVBoxLayout(self.settings_page)
+        settings_layout.setSpacing(self.scale_size(20))
+        settings_layout.setContentsMargins(self.scale_size(20), self.scale_size(20), 
+                                         self.scale_size(20), self.scale_size(20))
+        
+        # 标题
+        title_label = QLabel("⚙️ 设置")
+        title_label.setAlignment(Qt.AlignCenter)
+        title_label.setFont(QFont("Arial", self.scale_font_size(18), QFont.Bold))
+        title_label.setStyleSheet(f"""
+            QLabel {{
+                color: #2c3e50;
+                padding: {self.scale_size(15)}px;
+                background-color: #ecf0f1;
+                border: 2px solid #bdc3c7;
+                border-radius: {self.scale_size(10)}px;
+                margin-bottom: {self.scale_size(10)}px;
+            }}
+        """)
+        settings_layout.addWidget(title_label)
+        
+        # 设置内容区域
+        content_widget = QWidget()
+        content_layout = QVBoxLayout(content_widget)
+        content_layout.setSpacing(self.scale_size(15))
+        
+        # 字体大小设置
+        font_group = QGroupBox("字体大小设置")
+        font_group.setFont(QFont("Arial", self.scale_font_size(12), QFont.Bold))
+        font_group.setStyleSheet(f"""
+            QGroupBox {{
+                font-weight: bold;
+                border: 2px solid #3498db;
+                border-radius: {self.scale_size(8)}px;
+                margin-top: {self.scale_size(10)}px;
+                padding-top: {self.scale_size(10)}px;
+            }}
+            QGroupBox::title {{
+                subcontrol-origin: margin;
+                left: {self.scale_size(10)}px;
+                padding: 0 {self.scale_size(5)}px 0 {self.scale_size(5)}px;
+                color: #2c3e50;
+            }}
+        """)
+        font_layout = QHBoxLayout(font_group)
+        
+        font_label = QLabel("字体大小:")
+        font_label.setFont(QFont("Arial", self.scale_font_size(11)))
+        font_layout.addWidget(font_label)
+        
+        self.font_size_spinbox = QSpinBox()
+        self.font_size_spinbox.setRange(8, 20)
+        self.font_size_spinbox.setValue(getattr(self, 'saved_font_size', 9))
+        self.font_size_spinbox.setSuffix(" pt")
+        self.font_size_spinbox.setFont(QFont("Arial", self.scale_font_size(11)))
+        self.font_size_spinbox.setStyleSheet(f"""
+            QSpinBox {{
+                border: 2px solid #bdc3c7;
+                border-radius: {self.scale_size(5)}px;
+                padding: {self.scale_size(5)}px;
+                background-color: white;
+                min-width: {self.scale_size(80)}px;
+            }}
+            QSpinBox:focus {{
+                border-color: #3498db;
+            }}
+        """)
+        self.font_size_spinbox.valueChanged.connect(self.on_font_size_changed)
+        font_layout.addWidget(self.font_size_spinbox)
+        
+        apply_font_btn = QPushButton("应用字体")
+        apply_font_btn.setFont(QFont("Arial", self.scale_font_size(10), QFont.Bold))
+        apply_font_btn.setMinimumHeight(self.scale_button_size(50))
+        apply_font_btn.setStyleSheet(f"""
+            QPushButton {{
+                background-color: #27ae60;
+                color: white;
+                border: none;
+                padding: {self.scale_button_size(12)}px {self.scale_button_size(24)}px;
+                border-radius: {self.scale_size(8)}px;
+                font-weight: bold;
+                min-height: {self.scale_button_size(40)}px;
+            }}
+            QPushButton:hover {{
+                background-color: #229954;
+            }}
+            QPushButton:pressed {{
+                background-color: #1e8449;
+            }}
+        """)
+        apply_font_btn.clicked.connect(self.apply_font_size)
+        font_layout.addWidget(apply_font_btn)
+        
+        font_layout.addStretch()
+        content_layout.addWidget(font_group)
+        
+        # 界面大小设置
+        size_group = QGroupBox("界面大小设置")
+        size_group.setFont(QFont("Arial", self.scale_font_size(12), QFont.Bold))
+        size_group.setStyleSheet(f"""
+            QGroupBox {{
+                font-weight: bold;
+                border: 2px solid #e67e22;
+                border-radius: {self.scale_size(8)}px;
+                margin-top: {self.scale_size(10)}px;
+                padding-top: {self.scale_size(10)}px;
+            }}
+            QGroupBox::title {{
+                subcontrol-origin: margin;
+                left: {self.scale_size(10)}px;
+                padding: 0 {self.scale_size(5)}px 0 {self.scale_size(5)}px;
+                color: #2c3e50;
+            }}
+        """)
+        size_layout = QVBoxLayout(size_group)
+        
+        # 自动调整界面大小选项
+        auto_resize_layout = QHBoxLayout()
+        self.auto_resize_checkbox = QCheckBox("自动调整界面大小")
+        self.auto_resize_checkbox.setChecked(getattr(self, 'saved_auto_resize', False))
+        self.auto_resize_checkbox.setFont(QFont("Arial", self.scale_font_size(11)))
+        self.auto_resize_checkbox.setStyleSheet(f"""
+            QCheckBox {{
+                spacing: {self.scale_size(8)}px;
+            }}
+            QCheckBox::indicator {{
+                width: {self.scale_size(18)}px;
+                height: {self.scale_size(18)}px;
+            }}
+            QCheckBox::indicator:unchecked {{
+                border: 2px solid #bdc3c7;
+                border-radius: {self.scale_size(3)}px;
+                background-color: white;
+            }}
+            QCheckBox::indicator:checked {{
+                border: 2px solid #e67e22;
+                border-radius: {self.scale_size(3)}px;
+                background-color: #e67e22;
+                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
+            }}
+        """)
+        self.auto_resize_checkbox.stateChanged.connect(self.on_auto_resize_changed)
+        auto_resize_layout.addWidget(self.auto_resize_checkbox)
+        auto_resize_layout.addStretch()
+        size_layout.addLayout(auto_resize_layout)
+        
+        # 手动调整界面大小按钮
+        manual_resize_layout = QHBoxLayout()
+        resize_btn = QPushButton("🔧 调整界面大小")
+        resize_btn.setFont(QFont("Arial", self.scale_font_size(10), QFont.Bold))
+        resize_btn.setMinimumHeight(self.scale_button_size(50))
+        resize_btn.setStyleSheet(f"""
+            QPushButton {{
+                background-color: #f39c12;
+                color: white;
+                border: none;
+                padding: {self.scale_button_size(12)}px {self.scale_button_size(24)}px;
+                border-radius: {self.scale_size(8)}px;
+                font-weight: bold;
+                min-height: {self.scale_button_size(40)}px;
+            }}
+            QPushButton:hover {{
+                background-color: #e67e22;
+            }}
+            QPushButton:pressed {{
+                background-color: #d35400;
+            }}
+        """)
+        resize_btn.clicked.connect(self.adjust_window_size)
+        manual_resize_layout.addWidget(resize_btn)
+        manual_resize_layout.addStretch()
+        size_layout.addLayout(manual_resize_layout)
+        
+        content_layout.addWidget(size_group)
+        
+        # 路径映射设置
+        mapping_group = QGroupBox("路径映射设置")
+        mapping_group.setFont(QFont("Arial", self.scale_font_size(12), QFont.Bold))
+        mapping_group.setStyleSheet(f"""
+            QGroupBox {{
+                font-weight: bold;
+                border: 2px solid #9b59b6;
+                border-radius: {self.scale_size(8)}px;
+                margin-top: {self.scale_size(10)}px;
+                padding-top: {self.scale_size(10)}px;
+            }}
+            QGroupBox::title {{
+                subcontrol-origin: margin;
+                left: {self.scale_size(10)}px;
+                padding: 0 {self.scale_size(5)}px 0 {self.scale_size(5)}px;
+                color: #2c3e50;
+            }}
+        """)
+        mapping_layout = QVBoxLayout(mapping_group)
+        
+        # 默认前缀（未映射的盘符使用）
+        prefix_layout = QHBoxLayout()
+        prefix_label = QLabel("默认前缀:")
+        prefix_label.setFont(QFont("Arial", self.scale_font_size(11)))
+        prefix_layout.addWidget(prefix_label)
+        
+        self.nas_prefix_edit = QLineEdit(self.nas_prefix)
+        self.nas_prefix_edit.setFont(QFont("Consolas", self.scale_font_size(11)))
+        self.nas_prefix_edit.setStyleSheet(f"""
+            QLineEdit {{
+                border: 2px solid #bdc3c7;
+                border-radius: {self.scale_size(5)}px;
+                padding: {self.scale_size(5)}px;
+                background-color: white;
+            }}
+            QLineEdit:focus {{
+                border-color: #9b59b6;
+            }}
+        """)
+        prefix_layout.addWidget(self.nas_prefix_edit)
+        
+        # 反向转换（Linux → Windows）时默认前缀对应的盘符
+        drive_label = QLabel("反向默认盘符:")
+        drive_label.setFont(QFont("Arial", self.scale_font_size(11)))
+        prefix_layout.addWidget(drive_label)
+        
+        self.default_drive_edit = QLineEdit(self.default_drive)
+        self.default_drive_edit.setFont(QFont("Consolas", self.scale_font_size(11)))
+        self.default_drive_edit.setMaximumWidth(self.scale_size(80))
+        self.default_drive_edit.setStyleSheet(self.nas_prefix_edit.styleSheet())
+        prefix_layout.addWidget(self.default_drive_edit)
+        mapping_layout.addLayout(prefix_layout)
+        
+        # 映射表：盘符（如 Z:）、UNC共享（如 \\nas\media）或其下的目录（如 Z:\Movies） -> NAS路径前缀
+        self.mapping_table = QTableWidget(0, 2)
+        self.mapping_table.setHorizontalHeaderLabels(["盘符 / UNC共享 / 目录", "NAS路径前缀"])
+        self.mapping_table.setFont(QFont("Consolas", self.scale_font_size(11)))
+        self.mapping_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.mapping_table.verticalHeader().setVisible(False)
+        self.mapping_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.mapping_table.setMinimumHeight(self.scale_size(150))
+        for source, prefix in self.path_mappings.items():
+            self.add_mapping_row(source, prefix)
+        mapping_layout.addWidget(self.mapping_table)
+        
+        # 映射表操作按钮
+        mapping_btn_layout = QHBoxLayout()
+        for text, color, hover, slot in (
+            ("➕ 添加映射", "#9b59b6", "#8e44ad", self.add_mapping_row),
+            ("➖ 删除所选", "#e74c3c", "#c0392b", self.remove_mapping_rows),
+            ("💾 保存映射", "#27ae60", "#229954", self.save_mappings),
+        ):
+            btn = QPushButton(text)
+            btn.setFont(QFont("Arial", self.scale_font_size(10), QFont.Bold))
+            btn.setMinimumHeight(self.scale_button_size(50))
+            btn.setStyleSheet(f"""
+                QPushButton {{
+                    background-color: {color};
+                    color: white;
+                    border: none;
+                    padding: {self.scale_button_size(12)}px {self.scale_button_size(24)}px;
+                    border-radius: {self.scale_size(8)}px;
+                    font-weight: bold;
+                    min-height: {self.scale_button_size(40)}px;
+                }}
+                QPushButton:hover {{
+                    background-color: {hover};
+                }}
+            """)
+            btn.clicked.connect(lambda checked=False, slot=slot: slot())
+            mapping_btn_layout.addWidget(btn)
+        mapping_btn_layout.addStretch()
+        mapping_layout.addLayout(mapping_btn_layout)
+        
+        content_layout.addWidget(mapping_group)
+        
+        # 添加弹性空间
+        content_layout.addStretch()
+        
+        settings_layout.addWidget(content_widget)
+        
+        # 返回按钮
+        back_btn = QPushButton("← 返回主页")
+        back_btn.setFont(QFont("Arial", self.scale_font_size(10), QFont.Bold))
+        back_btn.setMinimumHeight(self.scale_button_size(50))
+        back_btn.setStyleSheet(f"""
+            QPushButton {{
+                background-color: #e74c3c;
+                color: white;
+                border: none;
+                padding: {self.scale_button_size(12)}px {self.scale_button_size(24)}px;
+                border-radius: {self.scale_size(8)}px;
+                font-weight: bold;
+                min-height: {self.scale_button_size(40)}px;
+            }}
+            QPushButton:hover {{
+                background-color: #c0392b;
+            }}
+            QPushButton:pressed {{
+                background-color: #a93226;
+            }}
+        """)
+        back_btn.clicked.connect(self.show_main_page)
+        
+        # 按钮容器，居中显示
+        button_container = QWidget()
+        button_layout = QHBoxLayout(button_container)
+        button_layout.addStretch()
+        button_layout.addWidget(back_btn)
+        button_layout.addStretch()
+        
+        settings_layout.addWidget(button_container)
+    
+    def show_settings(self):
+        """显示设置页面（第一次显示时创建）"""
+        if self.settings_page is None:
+            self.settings_page = QWidget()
+            self.stacked_widget.addWidget(self.settings_page)
+            self.create_settings_page()
+        self.stacked_widget.setCurrentWidget(self.settings_page)
+    
+    def show_main_page(self):
+        """显示主页面"""
+        self.stacked_widget.setCurrentWidget(self.main_page)
+    
+    def on_font_size_changed(self, value):
+        """字体大小改变时的处理"""
+        self.saved_font_size = value
+    
+    def apply_font_size(self):
+        """应用字体大小设置"""
+        try:
+            # 更新所有文本控件的字体大小
+            new_font_size = self.font_size_spinbox.value()
+            self.saved_font_size = new_font_size
+            
+            # 保存设置到配置文件
+            self.save_config()
+            
+            # 立即应用字体大小到当前界面
+            self.update_all_fonts()
+            
+            QMessageBox.information(self, "设置已应用", 
+                                  f"字体大小已设置为 {new_font_size} pt 并立即生效喵~")
+        except Exception as e:
+            QMessageBox.critical(self, "错误", f"应用字体大小失败：{str(e)}")
+    
+    def update_all_fonts(self):
+        """更新所有控件的字体大小"""
+        try:
+            # 更新期间暂停重绘，所有控件的字体都设置好后再统一重新布局和绘制
+            self.setUpdatesEnabled(False)
+            self.update_widget_fonts(self.main_page)
+            # 设置页面尚未创建时无需更新
+            if self.settings_page is not None:
+                self.update_widget_fonts(self.settings_page)
+            self.update_widget_fonts(self.statusBar())
+            # 结果表格为固定行高，按新字体重新计算
+            self.output_view.verticalHeader().setDefaultSectionSize(
+                QFontMetrics(self.output_view.font()).height() + self.scale_size(6))
+        except Exception as e:
+            log.warning("更新字体时出错: %s", e)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def update_widget_fonts(self, page):
+        """按当前字体设置更新页面中所有控件的字体（一次遍历登记表，不再逐层查找子控件）"""
+        for widget, base_size in self.font_registry(page):
+            try:
+                font = widget.font()
+                font.setPointSize(max(8, self.scale_font_size(base_size)))  # 确保字体不会太小
+                widget.setFont(font)
+            except RuntimeError as e:
+                # 控件已被销毁
+                log.warning("更新控件字体时出错: %s", e)
+    
+    def font_registry(self, page):
+        """页面中需要缩放字体的控件及其基础字号，第一次使用时用一次 findChildren 收集
+
+        只登记页面本身和单独设置过字体的控件；容器、滚动条、表头等控件沿用父控件的字体，
+        不再逐个设置，避免每次设置都把字体再传递给所有子控件。
+        """
+        registry = self.font_registries.get(page)
+        if registry is None:
+            registry = [(widget, self.base_font_size(widget)) for widget in [page] + page.findChildren(QWidget)
+                        if widget is page or widget.testAttribute(Qt.WA_SetFont)]
+            self.font_registries[page] = registry
+        return registry
+    
+    @staticmethod
+    def base_font_size(widget):
+        """根据控件类型确定基础字号（只在收集登记表时判断一次，之后字号变化不影响分类）"""
+        if isinstance(widget, QLabel):
+            # 标题类标签使用较大字体
+            if "title" in widget.objectName().lower() or widget.font().pointSize() > 15:
+                return 18
+            return 12
+        if isinstance(widget, (QPushButton, QSpinBox, QCheckBox)):
+            # 按钮和输入控件
+            return 11
+        # 其他控件使用默认字体大小
+        return 12
+    
+    def add_mapping_row(self, source="", prefix=""):
+        """在映射表末尾添加一行"""
+        row = self.mapping_table.rowCount()
+        self.mapping_table.insertRow(row)
+        self.mapping_table.setItem(row, 0, QTableWidgetItem(source))
+        self.mapping_table.setItem(row, 1, QTableWidgetItem(prefix))
+    
+    def remove_mapping_rows(self):
+        """删除映射表中选中的行"""
+        rows = sorted({index.row() for index in self.mapping_table.selectedIndexes()}, reverse=True)
+        for row in rows:
+            self.mapping_table.removeRow(row)
+    
+    def save_mappings(self):
+        """校验并保存路径映射，立即重建转换器"""
+        mappings = {}
+        for row in range(self.mapping_table.rowCount()):
+            source_item = self.mapping_table.item(row, 0)
+            prefix_item = self.mapping_table.item(row, 1)
+            source = source_item.text().strip() if source_item else ""
+            if not source:
+                continue  # 跳过空行
+            mappings[source] = prefix_item.text().strip() if prefix_item else ""
+        nas_prefix = self.nas_prefix_edit.text().strip()
+        default_drive = self.default_drive_edit.text().strip()
+        
+        try:
+            converter = PathConverter(nas_prefix, mappings, default_drive)
+        except ValueError as e:
+            QMessageBox.warning(self, "警告", str(e))
+            return
+        
+        self.nas_prefix = nas_prefix
+        self.path_mappings = mappings
+        self.default_drive = converter.default_drive
+        self.converter = converter
+        if self.live_convert:
+            self.rebuild_live_output()
+        self.update_cache_label()
+        self.save_config()
+        QMessageBox.information(self, "设置已应用", f"已保存 {len(mappings)} 条路径映射并立即生效喵~")
+    
+    def on_auto_resize_changed(self, state):
+        """自动调整界面大小选项改变时的处理"""
+        self.saved_auto_resize = state == 2  # Qt.Checked = 2
+        self.save_config()
+        
+        if self.saved_auto_resize:
+            # 如果启用自动调整，立即执行一次
+            self.adjust_window_size()
+    
+    def adjust_window_size(self):
+        """调整界面大小"""
+        try:
+            # 获取当前DPI缩放
+            dpi_scale = self.get_dpi_scale()
+            
+            # 根据DPI缩放计算合适的窗口大小
+            base_width = 1249
+            base_height = 1046
+            
+            # 如果帮助信息展开，增加高度
+            if getattr(self, 'help_expanded', False):
+                base_height += 200
+            
+            new_width = int(base_width * dpi_scale)
+            new_height = int(base_height * dpi_scale)
+            
+            # 应用新的窗口大小
+            self.resize(new_width, new_height)
+            
+            # 保存新的窗口大小
+            self.save_config()
+            
+            QMessageBox.information(self, "界面调整完成", 
+                                  f"界面大小已调整为 {new_width}x{new_height}\n"
+                                  f"DPI缩放比例: {dpi_scale:.2f} 喵~")
+        except Exception as e:
+            QMessageBox.critical(self, "错误", f"调整界面大小失败：{str(e)}")
+
+class StartupTimer(QObject):
+    """启动计时（--startup-time）：窗口第一次绘制完成后输出各阶段用时并退出程序"""
+    def __init__(self, app, started, imported, created):
+        super().__init__(app)
+        self.app = app
+        self.started = started
+        self.imported = imported
+        self.created = created
+        self.painted = False
+        app.installEventFilter(self)
+    
+    def eventFilter(self, obj, event):
+        """收到第一个绘制事件后，等这一轮绘制全部完成再计时"""
+        if event.type() == QEvent.Paint and not self.painted:
+            self.painted = True
+            QTimer.singleShot(0, self.report)
+        return False
+    
+    def report(self):
+        """输出导入模块、创建窗口和首次绘制的用时（毫秒，从 main.py 开始执行算起）"""
+        painted = time.perf_counter()
+        print(f"启动用时: 导入 {(self.imported - self.started) * 1000:.0f} ms，"
+              f"创建窗口 {(self.created - self.imported) * 1000:.0f} ms，"
+              f"首次绘制 {(painted - self.created) * 1000:.0f} ms，"
+              f"合计 {(painted - self.started) * 1000:.0f} ms")
+        self.app.quit()
+
+def main(started):
+    """主函数，started 为 main.py 开始执行的时间（time.perf_counter）"""
+    imported = time.perf_counter()
+    setup_logging(level_from_argv(sys.argv[1:]))
+    app = QApplication(sys.argv)
+    
+    # 设置应用程序属性
+    app.setApplicationName("NAS路径转换工具")
+    app.setApplicationVersion(VERSION)
+    app.setOrganizationName("Sallos")
+    
+    # 创建主窗口
+    window = PathConverterGUI()
+    if "--startup-time" in sys.argv[1:]:
+        StartupTimer(app, started, imported, time.perf_counter())
+    window.show()
+    
+    # 启动应用程序
+    sys.exit(app.exec_())
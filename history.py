@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+转换历史索引
+把转换过的路径记录到本地SQLite数据库（WAL模式），用于审计时查询
+"某个Windows路径被转换成了哪个NAS路径、在什么时候"。
+同一对（原路径, 方向, 转换结果）只保存一行，记录首次、最近一次转换的时间和次数；
+原路径和转换结果都有索引，按前缀查询只读取匹配的索引范围，与记录总数基本无关。
+只使用标准库
+"""
+
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+from converter import pair_lines
+
+# 默认数据库文件路径（与配置文件同目录）
+DEFAULT_HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'history.db')
+
+# 每次查询最多返回的记录数
+DEFAULT_SEARCH_LIMIT = 200
+
+# 一条转换历史：原路径、转换方向、转换结果、首次和最近一次转换的时间（Unix时间戳）、转换次数
+HistoryEntry = namedtuple('HistoryEntry', 'source direction target first_seen last_seen count')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversions (
+    source TEXT NOT NULL,
+    direction TEXT NOT NULL,
+    target TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    count INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (source, direction, target)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS conversions_target ON conversions (target);
+"""
+
+_UPSERT = """
+INSERT INTO conversions (source, direction, target, first_seen, last_seen) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (source, direction, target) DO UPDATE SET last_seen = excluded.last_seen, count = count + 1
+"""
+
+_COLUMNS = "source, direction, target, first_seen, last_seen, count"
+
+# 按前缀查询时的上界：前缀后接最大的Unicode字符，[前缀, 上界) 即以前缀开头的所有字符串
+_MAX_CHAR = '\U0010ffff'
+
+
+class HistoryError(Exception):
+    """读写转换历史数据库失败"""
+
+
+def _clean(value):
+    """替换无法存入数据库的代理字符（surrogateescape 解码的非UTF-8字节）"""
+    return value.encode('utf-8', 'surrogateescape').decode('utf-8', 'replace')
+
+
+class ConversionHistory:
+    """转换历史数据库，可在多个线程中同时使用（每个线程一个连接，WAL模式下读写互不阻塞）
+
+    readonly 为 True 时只用于查询：数据库不存在时报错，而不是创建一个空数据库。
+    """
+
+    def __init__(self, path=DEFAULT_HISTORY_FILE, readonly=False):
+        self.path = path
+        self.readonly = readonly
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        # 立即创建表，无法打开数据库时在这里报错
+        self._connection()
+
+    def _connection(self):
+        """当前线程的数据库连接，首次使用时创建"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            try:
+                if self.readonly:
+                    if not os.path.exists(self.path):
+                        raise HistoryError(f"转换历史数据库 {self.path} 不存在")
+                    uri = pathlib.Path(self.path).absolute().as_uri() + '?mode=ro'
+                    connection = sqlite3.connect(uri, timeout=30, check_same_thread=False, uri=True)
+                else:
+                    connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+                    connection.execute("PRAGMA journal_mode=WAL")
+                    # WAL模式下只在检查点时同步磁盘，断电最多丢失最近的几批记录，不会损坏数据库
+                    connection.execute("PRAGMA synchronous=NORMAL")
+                    connection.executescript(_SCHEMA)
+            except sqlite3.Error as e:
+                raise HistoryError(f"无法打开转换历史数据库 {self.path}：{e}") from e
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def record(self, sources, results, direction, when=None):
+        """在一个事务中记录一批转换结果，返回记录的条数
+
+        转换结果与原路径相同的行（未匹配任何规则、原样输出）不是转换，不记录。
+        """
+        when = time.time() if when is None else when
+        rows = [(source, direction, target, when, when) for source, target in zip(sources, results)
+                if source != target]
+        if not rows:
+            return 0
+        connection = self._connection()
+        try:
+            try:
+                with connection:
+                    connection.executemany(_UPSERT, rows)
+            except UnicodeEncodeError:
+                rows = [(_clean(source), direction, _clean(target), when, when) for source, _, target, _, _ in rows]
+                with connection:
+                    connection.executemany(_UPSERT, rows)
+        except sqlite3.Error as e:
+            raise HistoryError(f"写入转换历史失败：{e}") from e
+        return len(rows)
+
+    def record_block(self, block, converted, convert, direction):
+        """记录一块多行文本及其整块转换结果，返回记录的条数"""
+        sources, results = pair_lines(block, converted, convert)
+        return self.record(sources, results, direction)
+
+    def search(self, text, limit=DEFAULT_SEARCH_LIMIT):
+        """查找原路径或转换结果以 text 开头的记录，返回 [HistoryEntry, ...]
+
+        先按原路径排序列出原路径匹配的记录，再列出只有转换结果匹配的记录，最多 limit 条。
+        前缀区分大小写。
+        """
+        if not text:
+            return []
+        text = _clean(text)
+        bounds = (text, text + _MAX_CHAR)
+        connection = self._connection()
+        try:
+            entries = [HistoryEntry(*row) for row in connection.execute(
+                f"SELECT {_COLUMNS} FROM conversions WHERE source >= ? AND source < ? ORDER BY source LIMIT ?",
+                bounds + (limit,))]
+            if len(entries) < limit:
+                entries.extend(HistoryEntry(*row) for row in connection.execute(
+                    f"SELECT {_COLUMNS} FROM conversions INDEXED BY conversions_target "
+                    "WHERE target >= ?1 AND target < ?2 AND NOT (source >= ?1 AND source < ?2) "
+                    "ORDER BY target LIMIT ?3",
+                    bounds + (limit - len(entries),)))
+        except sqlite3.Error as e:
+            raise HistoryError(f"查询转换历史失败：{e}") from e
+        return entries
+
+    def close_thread(self):
+        """关闭当前线程的连接：在使用过数据库的工作线程结束前调用，避免每个线程留下一个连接"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            return
+        self._local.connection = None
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+        connection.close()
+
+    def close(self):
+        """关闭所有线程的连接"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
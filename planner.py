@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+路径移动计划（试运行）
+单次遍历种子列表，按保存路径分组并去重，每个保存路径只转换一次，
+只保留路径会变化的种子，按目标目录排序后输出为JSON或CSV
+"""
+
+import csv
+import json
+
+# 计划的输出格式
+PLAN_FORMATS = ('json', 'csv')
+
+
+def build_plan(torrents, convert_path):
+    """生成移动计划：{目标路径: {原保存路径: [hash, ...]}}
+
+    只遍历一次种子列表（按保存路径分组），之后每个不同的保存路径只转换一次；
+    重复出现的种子只保留第一次，转换结果与原路径相同的种子不包含在计划中。
+    """
+    by_source = {}
+    seen = set()
+    for torrent in torrents:
+        torrent_hash = torrent['hash']
+        if torrent_hash in seen:
+            continue
+        seen.add(torrent_hash)
+        save_path = torrent.get('save_path') or ''
+        hashes = by_source.get(save_path)
+        if hashes is None:
+            by_source[save_path] = [torrent_hash]
+        else:
+            hashes.append(torrent_hash)
+
+    plan = {}
+    for save_path, hashes in by_source.items():
+        target = convert_path(save_path)
+        if target and target != save_path:
+            sources = plan.get(target)
+            if sources is None:
+                sources = plan[target] = {}
+            sources[save_path] = hashes
+    return plan
+
+
+def summarize_plan(name, torrents, plan):
+    """将计划整理为按目标目录、原路径和 hash 排序的字典，torrents 为读取到的种子数"""
+    targets = []
+    changes = 0
+    for target in sorted(plan):
+        sources = [
+            {'source': source, 'count': len(hashes), 'hashes': sorted(hashes)}
+            for source, hashes in sorted(plan[target].items())
+        ]
+        count = sum(source['count'] for source in sources)
+        changes += count
+        targets.append({'target': target, 'count': count, 'sources': sources})
+    return {'instance': name, 'torrents': torrents, 'changes': changes, 'targets': targets}
+
+
+def write_plan_json(summaries, out):
+    """以JSON输出一个或多个计划（summarize_plan 的结果）"""
+    json.dump(summaries, out, ensure_ascii=False, indent=2)
+    out.write('\n')
+
+
+def write_plan_csv(summaries, out):
+    """以CSV输出计划：每行为一个实例中从同一原路径移动到同一目标目录的一组种子，hash 以 | 连接"""
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow(['instance', 'target', 'source', 'count', 'hashes'])
+    for summary in summaries:
+        for target in summary['targets']:
+            for source in target['sources']:
+                writer.writerow([summary['instance'], target['target'], source['source'], source['count'],
+                                 '|'.join(source['hashes'])])
+
+
+def write_plan(summaries, out, plan_format='json'):
+    """按指定格式输出计划"""
+    if plan_format == 'csv':
+        write_plan_csv(summaries, out)
+    else:
+        write_plan_json(summaries, out)
+
+
+def load_torrents(src):
+    """读取 torrents/info 导出的种子列表（JSON数组，每项至少包含 hash 和 save_path）"""
+    torrents = json.load(src)
+    if not isinstance(torrents, list) or not all(isinstance(t, dict) and 'hash' in t for t in torrents):
+        raise ValueError("种子列表应为 torrents/info 返回的JSON数组，每一项都需要包含 hash")
+    return torrents
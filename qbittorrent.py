@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+qBittorrent WebUI API v2 客户端
+读取所有种子的保存路径，经路径转换器转换后批量调用 setLocation 移动
+只使用标准库（asyncio），每个客户端的所有请求复用同一个保持连接（keep-alive）的HTTP/1.1连接
+"""
+
+import asyncio
+import json
+from urllib.parse import urlencode, urlsplit
+
+from planner import build_plan
+
+# 默认WebUI地址
+DEFAULT_URL = "http://localhost:8080"
+
+# 每次 setLocation 请求携带的种子数（hash 以 | 连接）
+SET_LOCATION_BATCH_SIZE = 500
+
+
+class QBittorrentError(Exception):
+    """WebUI API 请求失败"""
+
+
+class QBittorrentConnectionError(QBittorrentError):
+    """连接失败、超时或服务器内部错误（5xx），可以重试"""
+
+
+class AsyncQBittorrentClient:
+    """qBittorrent WebUI API v2 异步客户端（asyncio）
+
+    同一个客户端的请求依次经由同一个连接发出；服务器关闭空闲连接时自动重连并重试一次。
+    """
+
+    def __init__(self, url=DEFAULT_URL, username=None, password=None, timeout=30):
+        parts = urlsplit(url if '://' in url else 'http://' + url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f"无效的WebUI地址：{url}")
+        try:
+            port = parts.port
+        except ValueError:
+            raise ValueError(f"无效的WebUI地址：{url}") from None
+        self.url = url
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.host = parts.hostname
+        self._port = port or (443 if parts.scheme == 'https' else 80)
+        self._scheme = parts.scheme
+        self._netloc = parts.netloc.rpartition('@')[2]
+        self._base_path = parts.path.rstrip('/')
+        self._cookie = None
+        self._reader = None
+        self._writer = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """关闭连接"""
+        if self._writer is not None:
+            writer = self._writer
+            self._reader = self._writer = None
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    def _prepare(self, endpoint, params=None, data=None):
+        """构造请求的路径、请求头和请求体"""
+        path = f"{self._base_path}/api/v2/{endpoint}"
+        if params:
+            path += '?' + urlencode(params)
+        headers = {'Referer': f"{self._scheme}://{self._netloc}"}
+        body = None
+        if data is not None:
+            body = urlencode(data).encode('utf-8')
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        if self._cookie:
+            headers['Cookie'] = self._cookie
+        return path, headers, body
+
+    def _handle_response(self, endpoint, status, cookie, content):
+        """记录会话Cookie并检查响应状态，返回响应内容"""
+        if cookie:
+            self._cookie = cookie.split(';', 1)[0]
+        if status == 200:
+            return content
+        message = f"{endpoint}：HTTP {status} {content.decode('utf-8', 'replace').strip()}"
+        if status == 403:
+            raise QBittorrentError(f"{endpoint}：没有权限（未登录或会话已过期）")
+        if status >= 500:
+            raise QBittorrentConnectionError(message)
+        raise QBittorrentError(message)
+
+    def _login_form(self):
+        """登录请求的表单"""
+        return {'username': self.username, 'password': self.password or ''}
+
+    @staticmethod
+    def _check_login(content):
+        """检查登录结果"""
+        if content.strip() != b'Ok.':
+            raise QBittorrentError("登录失败：用户名或密码错误")
+
+    @staticmethod
+    def _parse_json(endpoint, content):
+        """解析JSON响应"""
+        try:
+            return json.loads(content)
+        except ValueError as e:
+            raise QBittorrentError(f"{endpoint}：无法解析的响应：{e}") from e
+
+    async def _request(self, method, endpoint, params=None, data=None):
+        """发送API请求并返回响应内容，请求失败时抛出 QBittorrentError"""
+        path, headers, body = self._prepare(endpoint, params, data)
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self._netloc}"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        if body is not None:
+            lines.append(f"Content-Length: {len(body)}")
+        request = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + (body or b'')
+
+        for attempt in range(2):
+            reused = self._writer is not None
+            try:
+                status, response_headers, content = await asyncio.wait_for(
+                    self._exchange(request), self.timeout)
+                break
+            except (ConnectionError, asyncio.IncompleteReadError) as e:
+                # 服务器关闭了空闲的保持连接：重新连接后重试一次
+                await self.close()
+                if attempt or not reused:
+                    raise QBittorrentConnectionError(f"连接WebUI失败：{e}") from e
+            except (OSError, asyncio.TimeoutError, ValueError) as e:
+                await self.close()
+                raise QBittorrentConnectionError(f"连接WebUI失败：{str(e) or '请求超时'}") from e
+
+        if response_headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return self._handle_response(endpoint, status, response_headers.get('set-cookie'), content)
+
+    async def _exchange(self, request):
+        """在保持的连接上发送一个请求并读取完整响应，返回 (状态码, 小写的响应头, 内容)"""
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(
+                self.host, self._port, ssl=self._scheme == 'https')
+        self._writer.write(request)
+        await self._writer.drain()
+
+        reader = self._reader
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("服务器关闭了连接")
+        try:
+            status = int(status_line.split(None, 2)[1])
+        except (IndexError, ValueError):
+            raise QBittorrentConnectionError(
+                f"无效的HTTP响应：{status_line.decode('latin-1').strip() or '空状态行'}") from None
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b';', 1)[0], 16)
+                if size == 0:
+                    while await reader.readline() not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            content = b''.join(chunks)
+        elif 'content-length' in headers:
+            content = await reader.readexactly(int(headers['content-length']))
+        else:
+            # 没有长度信息时读到连接关闭为止
+            content = await reader.read()
+            headers['connection'] = 'close'
+        if status_line.startswith(b'HTTP/1.0') and headers.get('connection', '').lower() != 'keep-alive':
+            headers['connection'] = 'close'
+        return status, headers, content
+
+    async def login(self):
+        """登录WebUI，未设置用户名时跳过（WebUI对本机或白名单地址免登录）"""
+        if self.username is None:
+            return
+        self._check_login(await self._request('POST', 'auth/login', data=self._login_form()))
+
+    async def torrents_info(self, **params):
+        """获取种子列表（torrents/info），可传入 filter、category、hashes 等过滤参数"""
+        return self._parse_json('torrents/info', await self._request('GET', 'torrents/info', params=params))
+
+    async def sync_maindata(self, rid=0):
+        """获取自 rid 以来变化的数据（sync/maindata），rid 为 0 时返回全部数据"""
+        return self._parse_json('sync/maindata', await self._request('GET', 'sync/maindata', params={'rid': rid}))
+
+    async def set_location(self, hashes, location):
+        """将一批种子移动到同一个保存路径（torrents/setLocation）"""
+        await self._request('POST', 'torrents/setLocation', data={
+            'hashes': '|'.join(hashes),
+            'location': location,
+        })
+
+
+def plan_relocations(torrents, convert_path):
+    """按目标路径分组需要移动的种子，返回 {目标路径: [hash, ...]}
+
+    相同的保存路径只转换一次；转换结果与原路径相同（未映射）的种子不会移动。
+    """
+    return {
+        target: [torrent_hash for hashes in sources.values() for torrent_hash in hashes]
+        for target, sources in build_plan(torrents, convert_path).items()
+    }
+
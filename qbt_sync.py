@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+多个qBittorrent实例的并发同步
+使用asyncio同时连接多个WebUI，限制同时进行的请求数及每个主机的请求速率，
+连接失败的请求按指数退避自动重试，并统计每个实例的处理速度；
+监视模式通过 sync/maindata 的 rid 游标只获取和处理有变化的种子
+"""
+
+import asyncio
+import time
+from functools import partial
+
+from qbittorrent import (
+    SET_LOCATION_BATCH_SIZE, AsyncQBittorrentClient, QBittorrentConnectionError, QBittorrentError,
+    plan_relocations,
+)
+
+# 默认同时进行的请求数
+DEFAULT_CONCURRENCY = 8
+
+# 默认重试次数
+DEFAULT_RETRIES = 3
+
+# 首次重试前等待的秒数，之后每次翻倍
+RETRY_DELAY = 0.5
+
+# 监视模式下两次轮询的默认间隔（秒）
+DEFAULT_WATCH_INTERVAL = 2.0
+
+
+class RateLimiter:
+    """限制请求速率：相邻两次请求至少间隔 1/rate 秒，rate 为 None 或 0 时不限制"""
+
+    def __init__(self, rate=None):
+        self.interval = 1 / rate if rate else 0
+        self._next_time = 0
+
+    async def acquire(self):
+        """等待到下一个可用的请求时间"""
+        if not self.interval:
+            return
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        # 先预约时间再等待，同时等待的多个请求依次错开
+        start = max(now, self._next_time)
+        self._next_time = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class SyncResult:
+    """单个实例的同步结果"""
+
+    def __init__(self, name, url):
+        self.name = name
+        self.url = url
+        self.torrents = 0  # 读取到的种子数
+        self.moved = 0  # 已移动的种子数
+        self.plan = {}  # 目标路径 -> [hash, ...]
+        self.requests = 0  # 成功的请求数
+        self.retries = 0  # 重试次数
+        self.elapsed = 0.0  # 用时（秒）
+        self.error = None  # 失败原因，成功时为 None
+
+    @property
+    def torrents_per_second(self):
+        """每秒处理的种子数"""
+        return self.torrents / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def requests_per_second(self):
+        """每秒完成的请求数"""
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self):
+        return (f"SyncResult(name={self.name!r}, torrents={self.torrents}, moved={self.moved}, "
+                f"requests={self.requests}, retries={self.retries}, error={self.error!r})")
+
+
+class MaindataState:
+    """sync/maindata 的增量状态
+
+    rid 为下一次请求使用的游标，save_paths 为每个种子当前的保存路径，
+    applied 为每个种子最后一次被移动到的路径，用于跳过移动本身产生的变化。
+    """
+
+    def __init__(self):
+        self.rid = 0
+        self.save_paths = {}
+        self.applied = {}
+
+    def update(self, data):
+        """合并一次 sync/maindata 的响应，返回新增或保存路径有变化的种子的 hash 列表"""
+        torrents = data.get('torrents') or {}
+        if data.get('full_update'):
+            # 全量数据中没有的种子均已删除
+            for torrent_hash in self.save_paths.keys() - torrents.keys():
+                self._remove(torrent_hash)
+        for torrent_hash in data.get('torrents_removed') or ():
+            self._remove(torrent_hash)
+
+        changed = []
+        save_paths = self.save_paths
+        for torrent_hash, fields in torrents.items():
+            save_path = fields.get('save_path')
+            if save_path is not None and save_paths.get(torrent_hash) != save_path:
+                save_paths[torrent_hash] = save_path
+                changed.append(torrent_hash)
+        self.rid = data.get('rid', self.rid)
+        return changed
+
+    def _remove(self, torrent_hash):
+        self.save_paths.pop(torrent_hash, None)
+        self.applied.pop(torrent_hash, None)
+
+    def reset(self):
+        """下一次请求重新获取全部数据（移动失败后调用），已移动的记录保留"""
+        self.rid = 0
+        self.save_paths.clear()
+
+    def plan(self, changed, convert_path):
+        """为有变化的种子生成移动计划，保存路径正是上次移动目标的种子不再处理"""
+        save_paths = self.save_paths
+        applied = self.applied
+        return plan_relocations(
+            ({'hash': torrent_hash, 'save_path': save_paths[torrent_hash]}
+             for torrent_hash in changed if applied.get(torrent_hash) != save_paths[torrent_hash]),
+            convert_path,
+        )
+
+
+async def _call(result, semaphore, limiter, retries, request, *args):
+    """发送一个请求：受并发数和速率限制，连接失败时按指数退避重试
+
+    先在速率限制上等待、再占用并发数，等待限速的主机不会占着并发数拖慢其他主机。
+    """
+    for attempt in range(retries + 1):
+        await limiter.acquire()
+        async with semaphore:
+            try:
+                response = await request(*args)
+            except QBittorrentConnectionError:
+                if attempt == retries:
+                    raise
+            else:
+                result.requests += 1
+                return response
+        result.retries += 1
+        await asyncio.sleep(RETRY_DELAY * 2 ** attempt)
+
+
+async def sync_instance(client, name, convert_path, semaphore, limiter,
+                        retries=DEFAULT_RETRIES, batch_size=SET_LOCATION_BATCH_SIZE):
+    """同步单个实例：读取所有种子，转换保存路径后按目标目录分批移动，返回 SyncResult"""
+    result = SyncResult(name, client.url)
+    call = partial(_call, result, semaphore, limiter, retries)
+    start = time.perf_counter()
+    try:
+        if client.username is not None:
+            await call(client.login)
+        torrents = await call(client.torrents_info)
+        result.torrents = len(torrents)
+        result.plan = plan_relocations(torrents, convert_path)
+        for location, hashes in result.plan.items():
+            for offset in range(0, len(hashes), batch_size):
+                batch = hashes[offset:offset + batch_size]
+                await call(client.set_location, batch, location)
+                result.moved += len(batch)
+    except QBittorrentError as e:
+        result.error = str(e)
+    finally:
+        await client.close()
+        result.elapsed = time.perf_counter() - start
+    return result
+
+
+async def fetch_instance(client, name, semaphore, limiter, retries=DEFAULT_RETRIES):
+    """只读取单个实例的种子列表（试运行时使用），返回 (SyncResult, 种子列表)，失败时种子列表为空"""
+    result = SyncResult(name, client.url)
+    call = partial(_call, result, semaphore, limiter, retries)
+    start = time.perf_counter()
+    torrents = []
+    try:
+        if client.username is not None:
+            await call(client.login)
+        torrents = await call(client.torrents_info)
+        result.torrents = len(torrents)
+    except QBittorrentError as e:
+        result.error = str(e)
+    finally:
+        await client.close()
+        result.elapsed = time.perf_counter() - start
+    return result, torrents
+
+
+async def watch_instance(client, name, convert_path, semaphore, limiter, interval=DEFAULT_WATCH_INTERVAL,
+                         retries=DEFAULT_RETRIES, batch_size=SET_LOCATION_BATCH_SIZE, report=None, polls=None):
+    """监视单个实例：轮询 sync/maindata，只转换并移动新增或保存路径有变化的种子，返回 SyncResult
+
+    每次轮询有移动或出错时调用 report(result, plan)，出错原因记录在 result.error 中；
+    出错后下一次轮询重新登录并获取全部数据。polls 为轮询次数，None 表示一直运行直到任务被取消。
+    """
+    result = SyncResult(name, client.url)
+    state = MaindataState()
+    call = partial(_call, result, semaphore, limiter, retries)
+    start = time.perf_counter()
+    logged_in = client.username is None
+    count = 0
+    try:
+        while polls is None or count < polls:
+            if count:
+                await asyncio.sleep(interval)
+            count += 1
+            plan = {}
+            try:
+                if not logged_in:
+                    await call(client.login)
+                    logged_in = True
+                changed = state.update(await call(client.sync_maindata, state.rid))
+                result.torrents = len(state.save_paths)
+                plan = state.plan(changed, convert_path)
+                for location, hashes in plan.items():
+                    for offset in range(0, len(hashes), batch_size):
+                        batch = hashes[offset:offset + batch_size]
+                        await call(client.set_location, batch, location)
+                        result.moved += len(batch)
+                        state.applied.update(dict.fromkeys(batch, location))
+                result.error = None
+            except QBittorrentError as e:
+                # 会话可能已过期，未完成的移动需要重新计划
+                result.error = str(e)
+                logged_in = client.username is None
+                state.reset()
+            if (plan or result.error is not None) and report is not None:
+                report(result, plan)
+    finally:
+        await client.close()
+        result.elapsed = time.perf_counter() - start
+    return result
+
+
+def _prepare_clients(instances, rate):
+    """为每个实例创建异步客户端，同一主机上的多个实例（不同端口）共用一个速率限制
+
+    返回 [(名称, 客户端, 速率限制), ...]；地址无效时在发出任何请求之前抛出 ValueError。
+    """
+    limiters = {}
+    prepared = []
+    for instance in instances:
+        client = AsyncQBittorrentClient(instance['url'], instance.get('username'), instance.get('password'))
+        limiter = limiters.get(client.host)
+        if limiter is None:
+            limiter = limiters[client.host] = RateLimiter(rate)
+        prepared.append((instance.get('name') or instance['url'], client, limiter))
+    return prepared
+
+
+async def sync_instances(instances, convert_path, concurrency=DEFAULT_CONCURRENCY, rate=None,
+                         retries=DEFAULT_RETRIES, batch_size=SET_LOCATION_BATCH_SIZE):
+    """并发同步多个实例，返回与 instances 顺序一致的 SyncResult 列表
+
+    instances 中的每一项为包含 url，以及可选的 name、username、password 的字典；
+    concurrency 为所有实例合计同时进行的请求数，rate 为每个主机每秒的最大请求数。
+    """
+    prepared = _prepare_clients(instances, rate)
+    semaphore = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(*(
+        sync_instance(client, name, convert_path, semaphore, limiter, retries, batch_size)
+        for name, client, limiter in prepared
+    ))
+
+
+async def watch_instances(instances, convert_path, interval=DEFAULT_WATCH_INTERVAL, concurrency=DEFAULT_CONCURRENCY,
+                          rate=None, retries=DEFAULT_RETRIES, batch_size=SET_LOCATION_BATCH_SIZE,
+                          report=None, polls=None):
+    """同时监视多个实例（参数含义同 sync_instances 与 watch_instance），返回 SyncResult 列表"""
+    prepared = _prepare_clients(instances, rate)
+    semaphore = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(*(
+        watch_instance(client, name, convert_path, semaphore, limiter, interval, retries, batch_size,
+                       report, polls)
+        for name, client, limiter in prepared
+    ))
+
+
+async def fetch_instances(instances, concurrency=DEFAULT_CONCURRENCY, rate=None, retries=DEFAULT_RETRIES):
+    """并发读取多个实例的种子列表，返回与 instances 顺序一致的 [(SyncResult, 种子列表), ...]"""
+    prepared = _prepare_clients(instances, rate)
+    semaphore = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(*(
+        fetch_instance(client, name, semaphore, limiter, retries)
+        for name, client, limiter in prepared
+    ))
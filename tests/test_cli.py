@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+命令行模式的测试：启动时不导入可选功能的模块，参数默认值与各模块一致
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import cli
+
+
+class LazyImportTest(unittest.TestCase):
+    def test_import_does_not_load_optional_features(self):
+        code = ("import sys, cli; print(' '.join(m for m in ('asyncio', 'sqlite3', 'concurrent.futures', "
+                "'history', 'planner', 'qbt_sync', 'walker') if m in sys.modules))")
+        loaded = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+        self.assertEqual(loaded.stdout.strip(), '')
+
+    def test_defaults_match_modules(self):
+        import history
+        import planner
+        import qbt_sync
+        import walker
+
+        for module, names in (
+            (history, ('DEFAULT_HISTORY_FILE', 'DEFAULT_SEARCH_LIMIT')),
+            (planner, ('PLAN_FORMATS',)),
+            (qbt_sync, ('DEFAULT_CONCURRENCY', 'DEFAULT_RETRIES', 'DEFAULT_WATCH_INTERVAL')),
+            (walker, ('DEFAULT_WALK_WORKERS',)),
+        ):
+            for name in names:
+                self.assertEqual(getattr(cli, name), getattr(module, name), name)
+
+
+if __name__ == '__main__':
+    unittest.main()
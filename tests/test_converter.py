@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+路径转换器的测试：整块转换与逐行转换的结果一致
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from converter import PathConverter
+
+
+class AutoBlockTest(unittest.TestCase):
+    def assert_block_matches_lines(self, converter, text):
+        expected = '\n'.join(filter(None, map(converter.convert_auto, text.split('\n'))))
+        self.assertEqual(converter.convert_auto_block(text), expected, repr(text))
+
+    def test_mixed_slash_unc_lines_match_per_line(self):
+        for prefix in ('', '/', '/share'):
+            converter = PathConverter(prefix)
+            linux = prefix.rstrip('/') + '/Movies/a.mkv'
+            for text in (
+                '/\\host\\share\\a',
+                f'{linux}\n/\\host\\share\\b',
+                f'/\\host\\share\\c\n{linux}\n',
+                f'{linux}\n//host/share/d',
+                f'{linux}\nZ:\\Movies\\e',
+            ):
+                with self.subTest(prefix=prefix, text=text):
+                    self.assert_block_matches_lines(converter, text)
+
+    def test_linux_only_block_uses_reverse_conversion(self):
+        converter = PathConverter('/share')
+        self.assertEqual(converter.convert_auto_block('/share/a\n/share/b/c\n'), 'Z:\\a\nZ:\\b\\c')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+qBittorrent 客户端与并发同步的测试
+在本机启动一个模拟 WebUI API v2 的HTTP/1.1服务器（保持连接），不需要真实的qBittorrent
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from converter import TO_LINUX, PathConverter
+from qbittorrent import AsyncQBittorrentClient, QBittorrentError
+from qbt_sync import MaindataState, RateLimiter, sync_instances, watch_instance
+
+USERNAME = 'admin'
+PASSWORD = 'adminadmin'
+
+
+class StubWebUI(ThreadingHTTPServer):
+    """模拟的WebUI：登录、torrents/info、torrents/setLocation 和 sync/maindata"""
+
+    daemon_threads = True
+
+    def __init__(self, torrents):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.lock = threading.Lock()
+        self.torrents = {torrent['hash']: dict(torrent) for torrent in torrents}
+        self.rid = 1
+        self.changed_at = dict.fromkeys(self.torrents, self.rid)  # hash -> 最后一次变化时的 rid
+        self.sessions = set()
+        self.logins = 0
+        self.connections = 0
+        self.requests = []  # (方法, 接口, 参数)
+        self.locations = []  # 每次 setLocation 的 (hashes, location)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def change(self, torrent_hash, **fields):
+        """修改或新增种子，之后的增量数据中会包含它"""
+        with self.lock:
+            self.rid += 1
+            self.torrents.setdefault(torrent_hash, {'hash': torrent_hash}).update(fields)
+            self.changed_at[torrent_hash] = self.rid
+
+    def expire_sessions(self):
+        """使所有会话过期，之后的请求返回 403"""
+        with self.lock:
+            self.sessions.clear()
+
+    def maindata(self, rid):
+        """rid 为 0 时返回全部种子，否则只返回 rid 之后有变化的种子"""
+        if rid == 0:
+            torrents = self.torrents
+        else:
+            torrents = {h: t for h, t in self.torrents.items() if self.changed_at[h] > rid}
+        data = {'rid': self.rid, 'torrents': {h: {'save_path': t['save_path']} for h, t in torrents.items()}}
+        if rid == 0:
+            data['full_update'] = True
+        return data
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def reply(self, status, body=b'', content_type='text/plain', cookie=None):
+        if not isinstance(body, bytes):
+            body, content_type = json.dumps(body).encode('utf-8'), 'application/json'
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if cookie:
+            self.send_header('Set-Cookie', f"SID={cookie}; HttpOnly; path=/")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_request(self, method):
+        server = self.server
+        parts = urlsplit(self.path)
+        endpoint = parts.path.partition('/api/v2/')[2]
+        params = {name: values[0] for name, values in parse_qs(parts.query).items()}
+        if method == 'POST':
+            length = int(self.headers.get('Content-Length', 0))
+            params.update((name, values[0]) for name, values in parse_qs(self.rfile.read(length).decode()).items())
+        with server.lock:
+            server.requests.append((method, endpoint, params))
+            if endpoint == 'auth/login':
+                server.logins += 1
+                if (params.get('username'), params.get('password')) != (USERNAME, PASSWORD):
+                    return self.reply(200, b'Fails.')
+                sid = f"s{server.logins}"
+                server.sessions.add(sid)
+                return self.reply(200, b'Ok.', cookie=sid)
+            cookie = (self.headers.get('Cookie') or '').partition('SID=')[2]
+            if cookie not in server.sessions:
+                return self.reply(403, b'Forbidden')
+            if endpoint == 'torrents/info':
+                return self.reply(200, list(server.torrents.values()))
+            if endpoint == 'sync/maindata':
+                return self.reply(200, server.maindata(int(params['rid'])))
+            if endpoint != 'torrents/setLocation' or method != 'POST':
+                return self.reply(404, b'Not Found')
+            hashes = params['hashes'].split('|')
+            server.locations.append((hashes, params['location']))
+        for torrent_hash in hashes:
+            server.change(torrent_hash, save_path=params['location'])
+        self.reply(200)
+
+    def do_GET(self):
+        self.handle_request('GET')
+
+    def do_POST(self):
+        self.handle_request('POST')
+
+
+TORRENTS = [
+    {'hash': 'a1', 'save_path': 'Z:\\Movies'},
+    {'hash': 'a2', 'save_path': 'Z:\\Movies'},
+    {'hash': 'a3', 'save_path': 'Z:\\Movies'},
+    {'hash': 'b1', 'save_path': 'Y:\\TV'},
+    {'hash': 'c1', 'save_path': '/share/done'},
+]
+
+
+class StubServerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = StubWebUI(TORRENTS)
+        thread = threading.Thread(target=self.server.serve_forever, args=(0.01,), daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.convert_path = PathConverter('/share').path_function(TO_LINUX)
+
+    def client(self, password=PASSWORD):
+        return AsyncQBittorrentClient(self.server.url, USERNAME, password, timeout=5)
+
+    def endpoints(self):
+        return [endpoint for _, endpoint, _ in self.server.requests]
+
+
+class ClientTest(StubServerTestCase):
+    def test_login_and_torrents_info_share_one_connection(self):
+        async def run():
+            async with self.client() as client:
+                await client.login()
+                first = await client.torrents_info()
+                second = await client.torrents_info(filter='all')
+            return first, second
+
+        first, second = asyncio.run(run())
+        self.assertEqual([t['hash'] for t in first], [t['hash'] for t in TORRENTS])
+        self.assertEqual(first, second)
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(self.server.requests[2][2], {'filter': 'all'})
+
+    def test_wrong_password(self):
+        async def run():
+            async with self.client('wrong') as client:
+                await client.login()
+
+        with self.assertRaisesRegex(QBittorrentError, '登录失败'):
+            asyncio.run(run())
+
+    def test_forbidden_without_session(self):
+        async def run():
+            async with self.client() as client:
+                await client.torrents_info()
+
+        with self.assertRaisesRegex(QBittorrentError, '没有权限'):
+            asyncio.run(run())
+
+    def test_set_location_joins_hashes(self):
+        async def run():
+            async with self.client() as client:
+                await client.login()
+                await client.set_location(['a1', 'a2'], '/share/Movies')
+
+        asyncio.run(run())
+        self.assertEqual(self.server.locations, [(['a1', 'a2'], '/share/Movies')])
+        self.assertEqual(self.server.torrents['a2']['save_path'], '/share/Movies')
+
+    def test_sync_maindata_rid(self):
+        async def run():
+            async with self.client() as client:
+                await client.login()
+                state = MaindataState()
+                full = state.update(await client.sync_maindata(state.rid))
+                rid = state.rid
+                self.server.change('d1', save_path='Z:\\New')
+                delta = await client.sync_maindata(state.rid)
+                return full, rid, delta, state.update(delta)
+
+        full, rid, delta, changed = asyncio.run(run())
+        self.assertEqual(sorted(full), sorted(t['hash'] for t in TORRENTS))
+        self.assertEqual(self.server.requests[-1][2], {'rid': str(rid)})
+        self.assertNotIn('full_update', delta)
+        self.assertEqual(changed, ['d1'])
+
+
+class MalformedResponseTest(unittest.TestCase):
+    def test_malformed_status_line_fails_only_that_instance(self):
+        async def garbage(reader, writer):
+            await reader.readuntil(b'\r\n\r\n')
+            writer.write(b'garbage\r\n\r\n')
+            await writer.drain()
+            writer.close()
+
+        async def run():
+            server = await asyncio.start_server(garbage, '127.0.0.1', 0)
+            url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+            async with server:
+                return await sync_instances([{'url': url}, {'url': url, 'name': 'second'}],
+                                            PathConverter('/share').path_function(TO_LINUX), retries=0)
+
+        results = asyncio.run(run())
+        self.assertEqual([result.name for result in results][1], 'second')
+        for result in results:
+            self.assertIn('无效的HTTP响应：garbage', result.error)
+
+
+class SyncTest(StubServerTestCase):
+    def test_sync_moves_changed_torrents_in_batches(self):
+        instances = [{'url': self.server.url, 'username': USERNAME, 'password': PASSWORD}]
+        result, = asyncio.run(sync_instances(instances, self.convert_path, batch_size=2))
+        self.assertIsNone(result.error)
+        self.assertEqual(result.torrents, 5)
+        self.assertEqual(result.moved, 4)
+        self.assertEqual(sorted(map(sorted, (hashes for hashes, _ in self.server.locations))),
+                         [['a1', 'a2'], ['a3'], ['b1']])
+        self.assertEqual(self.server.torrents['a3']['save_path'], '/share/Movies')
+        self.assertEqual(self.server.torrents['c1']['save_path'], '/share/done')
+
+    def test_watch_skips_own_moves_and_picks_up_new_torrents(self):
+        reports = []
+
+        def report(result, plan):
+            reports.append(plan)
+            if len(reports) == 1:
+                self.server.change('d1', save_path='Z:\\New')
+
+        async def run():
+            return await watch_instance(self.client(), 'stub', self.convert_path, asyncio.Semaphore(4),
+                                        RateLimiter(), interval=0, report=report, polls=3)
+
+        result = asyncio.run(run())
+        self.assertIsNone(result.error)
+        self.assertEqual(reports, [
+            {'/share/Movies': ['a1', 'a2', 'a3'], '/share/TV': ['b1']},
+            {'/share/New': ['d1']},
+        ])
+        rids = [int(params['rid']) for _, endpoint, params in self.server.requests if endpoint == 'sync/maindata']
+        self.assertEqual(rids[0], 0)
+        self.assertTrue(0 < rids[1] < rids[2])
+        self.assertEqual(result.moved, 5)
+
+    def test_watch_logs_in_again_after_403(self):
+        reports = []
+
+        def report(result, plan):
+            reports.append(result.error)
+            if len(reports) == 1:
+                self.server.expire_sessions()
+
+        async def run():
+            return await watch_instance(self.client(), 'stub', self.convert_path, asyncio.Semaphore(4),
+                                        RateLimiter(), interval=0, report=report, polls=3)
+
+        result = asyncio.run(run())
+        self.assertIsNone(reports[0])
+        self.assertIn('没有权限', reports[1])
+        self.assertIsNone(result.error)
+        self.assertEqual(self.server.logins, 2)
+        self.assertEqual(self.endpoints()[-2:], ['auth/login', 'sync/maindata'])
+        # 出错后重新获取全部数据
+        self.assertEqual(self.server.requests[-1][2], {'rid': '0'})
+
+
+if __name__ == '__main__':
+    unittest.main()
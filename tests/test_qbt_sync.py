@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+并发同步中并发数与速率限制的测试（不发出网络请求）
+"""
+
+import asyncio
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qbt_sync import RateLimiter, SyncResult, _call
+
+
+class CallTest(unittest.TestCase):
+    def test_rate_limited_host_does_not_hold_concurrency_slot(self):
+        finished = {}
+
+        async def request(name):
+            finished[name] = time.perf_counter()
+
+        async def run():
+            semaphore = asyncio.Semaphore(1)
+            slow, fast = RateLimiter(2), RateLimiter()
+            result = SyncResult('test', 'http://test')
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(_call(result, semaphore, slow, 0, request, f"slow{i}") for i in range(3)),
+                _call(result, semaphore, fast, 0, request, 'fast'),
+            )
+            return start, result
+
+        start, result = asyncio.run(run())
+        self.assertEqual(result.requests, 4)
+        # 限速主机的后两个请求分别在 0.5 秒和 1 秒后才发出，另一个主机的请求不必等待它们
+        self.assertLess(finished['fast'] - start, 0.2)
+        self.assertGreater(finished['slow2'] - start, 0.9)
+
+
+if __name__ == '__main__':
+    unittest.main()
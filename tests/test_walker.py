@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+目录树并行遍历的测试：符号链接循环
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from walker import walk_entries
+
+
+@unittest.skipUnless(hasattr(os, 'symlink'), "需要符号链接")
+class FollowSymlinksTest(unittest.TestCase):
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.root = temp.name
+        for name in ('x', 'z'):
+            os.mkdir(os.path.join(self.root, name))
+            with open(os.path.join(self.root, name, 'file.txt'), 'w'):
+                pass
+
+    def link(self, target, name):
+        try:
+            os.symlink(target, os.path.join(self.root, name), target_is_directory=True)
+        except OSError as e:
+            self.skipTest(f"无法创建符号链接：{e}")
+
+    def walk(self, follow_symlinks=True):
+        errors = []
+        paths = [os.path.relpath(path, self.root)
+                 for entries in walk_entries(self.root, 4, follow_symlinks, errors.append)
+                 for path, _ in entries]
+        return sorted(paths), errors
+
+    def test_mutually_linked_siblings_are_entered_once(self):
+        for i in range(3):
+            self.link(os.path.join('..', 'z'), os.path.join('x', f'y{i}'))
+            self.link(os.path.join('..', 'x'), os.path.join('z', f'w{i}'))
+        paths, errors = self.walk()
+        self.assertEqual(errors, [])
+        # 每个目录的内容只出现一次，链接本身只列出
+        self.assertEqual(len(paths), 2 + 2 + 6)
+        self.assertEqual(sum(path.endswith('file.txt') for path in paths), 2)
+
+    def test_link_to_ancestor_is_listed_not_entered(self):
+        self.link('..', os.path.join('x', 'up'))
+        paths, errors = self.walk()
+        self.assertEqual(errors, [])
+        self.assertEqual(paths, sorted(['x', 'z', os.path.join('x', 'file.txt'), os.path.join('z', 'file.txt'),
+                                        os.path.join('x', 'up')]))
+
+    def test_self_loop_is_reported(self):
+        self.link('loop', 'loop')
+        paths, errors = self.walk()
+        self.assertIn('loop', paths)
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], OSError)
+
+    def test_links_not_followed_by_default(self):
+        self.link(os.path.join('..', 'z'), os.path.join('x', 'y'))
+        paths, errors = self.walk(follow_symlinks=False)
+        self.assertEqual(errors, [])
+        self.assertNotIn(os.path.join('x', 'y', 'file.txt'), paths)
+
+
+if __name__ == '__main__':
+    unittest.main()
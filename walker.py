@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+目录树并行遍历
+使用线程池同时扫描多个目录（os.scandir），扫描完一个目录就立即产生其中的条目，
+适合为整个挂载的共享盘生成路径列表：网络文件系统上每次列目录的延迟可以互相重叠
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# 默认同时扫描的目录数
+DEFAULT_WALK_WORKERS = 16
+
+
+def _scan_directory(path, follow_symlinks, stopped, visit):
+    """扫描一个目录，返回 ([(路径, 是否目录), ...], [子目录, ...], [OSError, ...])
+
+    follow_symlinks 为真时，只进入 visit((st_dev, st_ino)) 返回真（第一次遇到）的目录。
+    """
+    entries = []
+    subdirs = []
+    errors = []
+    if stopped.is_set():
+        return entries, subdirs, errors
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+                # 指向目录的符号链接仍作为目录列出，但默认不进入
+                descend = is_dir and not entry.is_symlink()
+                if is_dir and follow_symlinks:
+                    # 同一个目录（经由不同的链接或循环链接）只进入一次
+                    st = entry.stat()
+                    descend = visit((st.st_dev, st.st_ino))
+            except OSError as e:
+                # 如链接循环（ELOOP）：仍然列出，但不进入，并报告错误
+                errors.append(e)
+                is_dir = descend = False
+            entries.append((entry.path, is_dir))
+            if descend:
+                subdirs.append(entry.path)
+    return entries, subdirs, errors
+
+
+def walk_entries(root, workers=DEFAULT_WALK_WORKERS, follow_symlinks=False, onerror=None):
+    """并行遍历 root 下的所有文件和目录（不含 root 本身），每扫描完一个目录产生一批 [(路径, 是否目录), ...]
+
+    各批的先后顺序取决于扫描完成的顺序；无法读取的目录或无法获取信息的条目（如循环的链接）
+    调用 onerror(OSError) 后跳过，onerror 为 None 时直接抛出。指向目录的符号链接默认只列出、不进入；
+    follow_symlinks 为真时进入，但每个目录（按设备号和inode）只进入一次，互相指向的链接不会造成循环。
+    """
+    results = queue.SimpleQueue()
+    stopped = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=workers)
+    visited = set()
+    lock = threading.Lock()
+
+    def visit(key):
+        """记录进入的目录，已经进入过时返回 False"""
+        with lock:
+            if key in visited:
+                return False
+            visited.add(key)
+            return True
+
+    def submit(path):
+        executor.submit(_scan_directory, path, follow_symlinks, stopped, visit).add_done_callback(results.put)
+
+    try:
+        if follow_symlinks:
+            st = os.stat(root)
+            visit((st.st_dev, st.st_ino))
+        submit(root)
+        pending = 1
+        while pending:
+            future = results.get()
+            pending -= 1
+            try:
+                entries, subdirs, errors = future.result()
+            except OSError as e:
+                if onerror is None:
+                    raise
+                onerror(e)
+                continue
+            for error in errors:
+                if onerror is None:
+                    raise error
+                onerror(error)
+            for path in subdirs:
+                submit(path)
+            pending += len(subdirs)
+            if entries:
+                yield entries
+    finally:
+        # 提前结束（出错或不再迭代）时，尚未开始的扫描任务直接返回
+        stopped.set()
+        executor.shutdown(wait=True)
+
+
+def walk_paths(root, as_root=None, workers=DEFAULT_WALK_WORKERS, follow_symlinks=False, onerror=None):
+    """并行遍历 root，按批产生路径字符串列表，目录以分隔符结尾
+
+    指定 as_root 时把本地的 root 替换为 as_root，例如把挂载点 /mnt/z 下的路径改写为 Z:\\ 下的
+    Windows路径：as_root 以 / 开头时使用 / 作为分隔符，否则使用 \\。
+    """
+    if as_root is None:
+        sep = os.sep
+        base = root.rstrip('\\/') + sep if root.rstrip('\\/') else root
+        rewrite = False
+    else:
+        sep = '/' if as_root.startswith('/') else '\\'
+        base = as_root.rstrip('\\/') + sep
+        rewrite = os.sep != sep
+    cut = len(os.path.join(root, ''))
+    for entries in walk_entries(root, workers, follow_symlinks, onerror):
+        paths = []
+        for path, is_dir in entries:
+            relative = path[cut:]
+            if rewrite:
+                relative = relative.replace(os.sep, sep)
+            paths.append(base + relative + sep if is_dir else base + relative)
+        yield paths